@@ -1,30 +1,56 @@
-import glob
+import functools
 import os
 import re
-import subprocess
 import sys
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import yaml
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from novaeco_cli.utils import cache, fs, github
+from novaeco_cli.utils.output import get_console
 
 # --- Regex Patterns for Traceability ---
+# Patterns run on raw file bytes, so sources are never decoded; IDs are ASCII by construction.
 # Matches: :id: REQ_GATEWAY_FUNCTIONAL_0001 or :id: NEED_DATA_0001
-REQ_DEF_PATTERN = re.compile(r":id:\s*([A-Z]+_[A-Z_]+_\d{4})")
+REQ_DEF_PATTERN = re.compile(rb":id:\s*([A-Z]+_[A-Z_]+_\d{4})")
 
 # Matches: @pytest.mark.requirement("REQ_ID") OR @requirement("REQ_ID")
-PY_TEST_VERIFY_PATTERN = re.compile(r'@(?:pytest\.mark\.)?requirement\(\s*["\']([A-Z]+_[A-Z_]+_\d{4})["\']\s*\)')
+PY_TEST_VERIFY_PATTERN = re.compile(rb'@(?:pytest\.mark\.)?requirement\(\s*["\']([A-Z]+_[A-Z_]+_\d{4})["\']\s*\)')
 
 # Matches: // REQ_KERNEL_PERFORMANCE_0001 or // NEED_DATA_0001
-CPP_TEST_VERIFY_PATTERN = re.compile(r"//\s*([A-Z]+_[A-Z_]+_\d{4})")
+CPP_TEST_VERIFY_PATTERN = re.compile(rb"//\s*([A-Z]+_[A-Z_]+_\d{4})")
 
 # Matches Gherkin tags: @USECASE_QA_0001
-FEATURE_TEST_VERIFY_PATTERN = re.compile(r"@([A-Z]+_[A-Z_]+_\d{4})")
+FEATURE_TEST_VERIFY_PATTERN = re.compile(rb"@([A-Z]+_[A-Z_]+_\d{4})")
+
+# Literal every match of a pattern must contain. Files without it skip the regex engine entirely.
+SCAN_MARKERS = {
+    REQ_DEF_PATTERN: b":id:",
+    PY_TEST_VERIFY_PATTERN: b"requirement(",
+    CPP_TEST_VERIFY_PATTERN: b"//",
+    FEATURE_TEST_VERIFY_PATTERN: b"@",
+}
+
+# Rich markup for each matrix status
+STATUS_STYLES = {"VERIFIED": "bold green", "ORPHANED": "bold red", "DANGLING TEST": "bold yellow"}
+
+# Which verification pattern applies to which file type
+VERIFY_PATTERNS = {
+    ".py": PY_TEST_VERIFY_PATTERN,
+    ".cpp": CPP_TEST_VERIFY_PATTERN,
+    ".hpp": CPP_TEST_VERIFY_PATTERN,
+    ".feature": FEATURE_TEST_VERIFY_PATTERN,
+}
+
+# Golden component schema, used when no local novaeco checkout sits next to the component
+SCHEMA_URL = "https://api.github.com/repos/novaeco-tech/novaeco/contents/docs/source/architecture/templates/component-schema.yaml"
+SCHEMA_CACHE_FILE = "component-schema.json"
+
+# File reads dominate the scan, so we oversubscribe the cores
+SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 
 def register_subcommand(subparsers):
@@ -39,6 +65,18 @@ def register_subcommand(subparsers):
     p_trace = audit_subs.add_parser("traceability", help="V-Model Decomposition and Traceability")
     p_trace.add_argument("target", nargs="?", default=".", help="Directory to check")
     p_trace.add_argument("--global", action="store_true", dest="is_global", help="Run in Global L1-L5 mode (QA Repo)")
+    p_trace.add_argument(
+        "--format",
+        choices=["table", "tsv"],
+        default="table",
+        dest="output_format",
+        help="Matrix output: Rich table (default) or tab-separated rows on stdout for piping",
+    )
+
+    # Command 3: Both checks in one run
+    p_all = audit_subs.add_parser("all", help="Run structure and traceability audits together")
+    p_all.add_argument("target", nargs="?", default=".", help="Directory to check")
+    p_all.add_argument("--global", action="store_true", dest="is_global", help="Run traceability in Global L1-L5 mode")
 
 
 # ==============================================================================
@@ -46,8 +84,48 @@ def register_subcommand(subparsers):
 # ==============================================================================
 
 
+def fetch_remote_schema():
+    """
+    Fetches the schema text from GitHub, revalidating the copy cached under ~/.cache/novaeco
+    with If-None-Match. The cached copy is also used when offline or without a token.
+    """
+    console = get_console()
+    cached = cache.load_json(SCHEMA_CACHE_FILE)
+
+    token = github.get_token()
+    if not token:
+        if cached:
+            console.print("[dim]   No GitHub token available. Using cached schema.[/dim]")
+            return cached["text"]
+        console.print("[bold red]❌ Error:[/bold red] GITHUB_TOKEN not found. Required to fetch private schema.")
+        sys.exit(1)
+
+    # Use the GitHub API raw media type to get the file contents
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github.v3.raw"}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    try:
+        resp = requests.get(SCHEMA_URL, headers=headers, timeout=10)
+        if resp.status_code == 304:
+            return cached["text"]
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        if cached:
+            console.print(f"[yellow]⚠️  Could not refresh schema ({e}). Using cached copy.[/yellow]")
+            return cached["text"]
+        console.print(f"[bold red]❌ Error:[/bold red] Failed to fetch schema from GitHub: {e}")
+        sys.exit(1)
+
+    cache.save_json(SCHEMA_CACHE_FILE, {"etag": resp.headers.get("ETag"), "text": resp.text})
+    return resp.text
+
+
+@functools.lru_cache(maxsize=None)
 def load_schema(path):
-    """Attempts to load the schema locally, falls back to the GitHub API for DevContainers."""
+    """Attempts to load the schema locally, falls back to the GitHub API for DevContainers.
+    Memoized per path, so repeated audits in one run load and parse it once."""
+    console = get_console()
     # 1. Try Local (Works on Host Machine)
     local_schema_path = os.path.join(
         path, "..", "novaeco", "docs", "source", "architecture", "templates", "component-schema.yaml"
@@ -58,28 +136,12 @@ def load_schema(path):
 
     # 2. Try GitHub API (Works in DevContainers & CI)
     console.print("[dim]   Schema not found locally. Fetching from remote (novaeco-tech/novaeco)...[/dim]")
-    token = os.environ.get("GITHUB_TOKEN")
-    if not token:
-        try:
-            token = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True).stdout.strip()
-        except Exception:
-            console.print("[bold red]❌ Error:[/bold red] GITHUB_TOKEN not found. Required to fetch private schema.")
-            sys.exit(1)
+    return yaml.safe_load(fetch_remote_schema())
 
-    # Use the GitHub API raw media type to get the file contents
-    url = "https://api.github.com/repos/novaeco-tech/novaeco/contents/docs/source/architecture/templates/component-schema.yaml"
-    headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github.v3.raw"}
 
-    try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        return yaml.safe_load(resp.text)
-    except Exception as e:
-        console.print(f"[bold red]❌ Error:[/bold red] Failed to fetch schema from GitHub: {e}")
-        sys.exit(1)
-
-
-def audit_structure(path):
+def audit_structure(path) -> bool:
+    """Checks the component against the golden schema. Returns True if it complies."""
+    console = get_console()
     path = os.path.abspath(path)
     console.print(f"\n[bold blue]🔍 Auditing Structure & Drift ({os.path.basename(path)})...[/bold blue]")
 
@@ -88,27 +150,33 @@ def audit_structure(path):
 
     failed = False
 
+    dir_reqs = schema["directories"]["required"]
+    file_reqs = schema["files"]["required"]
+    content_rules = schema.get("content_rules", [])
+
+    # Resolve every rule path up front: one directory listing and set difference per distinct parent
+    layout = fs.compile_layout([*dir_reqs, *file_reqs, *(rule["path"] for rule in content_rules)])
+    missing = fs.find_missing(path, layout)
+
     # A. Check Directories
     console.print("[bold]1. Checking Directory Structure...[/bold]")
-    for dir_req in schema["directories"]["required"]:
-        target_dir = os.path.join(path, dir_req)
-        if not os.path.exists(target_dir):
+    for dir_req in dir_reqs:
+        if dir_req in missing:
             console.print(f"   [red]❌ Missing Directory:[/red] {dir_req}")
             failed = True
 
     # B. Check Files
     console.print("\n[bold]2. Checking Required Files...[/bold]")
-    for file_req in schema["files"]["required"]:
-        target_file = os.path.join(path, file_req)
-        if not os.path.exists(target_file):
+    for file_req in file_reqs:
+        if file_req in missing:
             console.print(f"   [red]❌ Missing File:[/red] {file_req}")
             failed = True
 
     # C. Content Drift (Check if workflows match DevTools standards)
     console.print("\n[bold]3. Checking Content Drift (Caller Workflows)...[/bold]")
-    for rule in schema.get("content_rules", []):
+    for rule in content_rules:
         target_file = os.path.join(path, rule["path"])
-        if not os.path.exists(target_file):
+        if rule["path"] in missing:
             console.print(f"   [red]❌ Missing Workflow:[/red] {rule['path']}")
             failed = True
             continue
@@ -126,9 +194,10 @@ def audit_structure(path):
 
     if failed:
         console.print("\n[bold red]🛑 Structural Audit Failed. Component has drifted from Golden Schema.[/bold red]")
-        sys.exit(1)
-    else:
-        console.print("\n[bold green]✨ Component Structure complies with ADR_KERNEL_0014.[/bold green]")
+        return False
+
+    console.print("\n[bold green]✨ Component Structure complies with ADR_KERNEL_0014.[/bold green]")
+    return True
 
 
 # ==============================================================================
@@ -136,87 +205,94 @@ def audit_structure(path):
 # ==============================================================================
 
 
-def audit_traceability(path, is_global=False):
+def collect_traceability(path, is_global=False):
+    """
+    Scans the component for requirement definitions and the tests verifying them.
+    Returns (definitions, verifications) and prints nothing, so it can run in the background.
+    """
     path = os.path.abspath(path)
-    mode = "GLOBAL (L1-L5)" if is_global else "LOCAL (L3-L5)"
-    console.print(f"\n[bold blue]🔍 Auditing V-Model Traceability [{mode}]...[/bold blue]")
-
     definitions = {}
     verifications = defaultdict(list)
 
+    # Global mode scans every sibling repository in the workspace
+    scan_root = os.path.join(path, "..") if is_global else path
+
+    # A single walk feeds both scans: .rst definitions and the verification sources
+    doc_files = []
+    code_files = []
+    for file_path in fs.walk_files(scan_root, (".rst", *VERIFY_PATTERNS)):
+        if not file_path.endswith(".rst"):
+            code_files.append(file_path)
+        elif "_generated" not in file_path:
+            doc_files.append(file_path)
+
     # 1. Scan for Definitions (.rst files)
-    doc_pattern = os.path.join(path, "**", "*.rst") if not is_global else os.path.join(path, "..", "**", "*.rst")
-    for file_path in glob.glob(doc_pattern, recursive=True):
-        if "_generated" in file_path:
-            continue
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    match = REQ_DEF_PATTERN.search(line)
-                    if match:
-                        definitions[match.group(1)] = os.path.relpath(file_path, path)
-        except Exception:
-            continue
+    for file_path in doc_files:
+        req_ids = scan_ids(file_path, REQ_DEF_PATTERN)
+        if req_ids:
+            rel_path = os.path.relpath(file_path, path)
+            for req_id in req_ids:
+                definitions[req_id] = rel_path
 
     # 2. Scan for Verifications (Python, C++, and Gherkin Features)
-    code_pattern = os.path.join(path, "**", "*.*") if not is_global else os.path.join(path, "..", "**", "*.*")
-    for file_path in glob.glob(code_pattern, recursive=True):
-        if not (
-            file_path.endswith(".py")
-            or file_path.endswith(".cpp")
-            or file_path.endswith(".hpp")
-            or file_path.endswith(".feature")
-        ):
-            continue
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-                # Find Python tests
-                if file_path.endswith(".py"):
-                    for req_id in PY_TEST_VERIFY_PATTERN.findall(content):
-                        verifications[req_id].append(os.path.relpath(file_path, path))
-
-                # Find C++ tests/logic
-                if file_path.endswith(".cpp") or file_path.endswith(".hpp"):
-                    for req_id in CPP_TEST_VERIFY_PATTERN.findall(content):
-                        verifications[req_id].append(os.path.relpath(file_path, path))
-
-                # Find BDD Feature tags
-                if file_path.endswith(".feature"):
-                    for req_id in FEATURE_TEST_VERIFY_PATTERN.findall(content):
-                        verifications[req_id].append(os.path.relpath(file_path, path))
-
-        except Exception:
-            continue
+    # Workers only read and match; results are merged here so 'verifications' is never shared
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        for file_path, req_ids in zip(code_files, pool.map(scan_verifications, code_files), strict=True):
+            if not req_ids:
+                continue
+            rel_path = os.path.relpath(file_path, path)
+            for req_id in req_ids:
+                verifications[req_id].append(rel_path)
 
-    # 3. Render the Master Traceability Matrix
-    table = Table(title="Traceability Matrix")
-    table.add_column("Requirement ID", style="cyan", no_wrap=True)
-    table.add_column("Status", justify="center")
-    table.add_column("Verified By", style="green")
+    return definitions, verifications
+
+
+def audit_traceability(path, is_global=False, output_format="table", collected=None) -> bool:
+    """
+    Builds the traceability matrix for the component. Returns True if nothing is orphaned or dangling.
+    With output_format="tsv" the matrix is streamed to stdout and all other output goes to stderr.
+    `collected` takes a (definitions, verifications) result already produced by collect_traceability().
+    """
+    console = get_console(stderr=output_format == "tsv")
+    path = os.path.abspath(path)
+    mode = "GLOBAL (L1-L5)" if is_global else "LOCAL (L3-L5)"
+    console.print(f"\n[bold blue]🔍 Auditing V-Model Traceability [{mode}]...[/bold blue]")
+
+    definitions, verifications = collected or collect_traceability(path, is_global)
 
+    # 3. Render the Master Traceability Matrix
     orphaned_reqs = 0
     dangling_tests = 0
 
-    for req_id in sorted(definitions.keys()):
-        tests = verifications.get(req_id, [])
-        if tests:
-            table.add_row(req_id, "[bold green]VERIFIED[/bold green]", f"{len(tests)} references")
-        else:
-            table.add_row(req_id, "[bold red]ORPHANED[/bold red]", "-")
-            orphaned_reqs += 1
+    if output_format == "tsv":
+        # Stream rows straight to stdout for piping; nothing is buffered
+        table = None
+        sys.stdout.write("requirement\tstatus\tverified_by\n")
+    else:
+        from rich.table import Table
 
-    # Check for tests that point to non-existent requirements
-    for req_id, test_files in verifications.items():
-        if req_id not in definitions:
-            table.add_row(req_id, "[bold yellow]DANGLING TEST[/bold yellow]", f"Found in {test_files[0]}")
+        table = Table(title="Traceability Matrix")
+        table.add_column("Requirement ID", style="cyan", no_wrap=True)
+        table.add_column("Status", justify="center")
+        table.add_column("Verified By", style="green")
+
+    for req_id, status, detail in iter_matrix(definitions, verifications):
+        if status == "ORPHANED":
+            orphaned_reqs += 1
+        elif status == "DANGLING TEST":
             dangling_tests += 1
 
-    console.print(table)
+        if table is None:
+            sys.stdout.write(f"{req_id}\t{status}\t{detail}\n")
+        else:
+            style = STATUS_STYLES[status]
+            table.add_row(req_id, f"[{style}]{status}[/{style}]", detail)
+
+    if table is not None:
+        console.print(table)
 
     # 4. Implicit Traceability (Dead Code / Coverage Check)
-    untested_files = check_implicit_traceability(path)
+    untested_files = check_implicit_traceability(path, stderr=output_format == "tsv")
 
     console.print("\n[bold]Summary:[/bold]")
     console.print(f"   Requirements Defined: {len(definitions)}")
@@ -226,15 +302,50 @@ def audit_traceability(path, is_global=False):
 
     if orphaned_reqs > 0 or dangling_tests > 0 or untested_files > 0:
         console.print("\n[bold red]🛑 Traceability Audit Failed. Fix orphaned items before release.[/bold red]")
-        sys.exit(1)
+        return False
+    return True
+
+
+def scan_ids(file_path, pattern):
+    """Returns every requirement ID `pattern` matches in a file, in one regex sweep over its bytes."""
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    if SCAN_MARKERS[pattern] not in data:
+        return []
+    # Interned so the definitions and verifications maps share one string per ID
+    return [sys.intern(req_id.decode("ascii")) for req_id in pattern.findall(data)]
+
+
+def scan_verifications(file_path):
+    """Returns the requirement IDs referenced by a single test or source file."""
+    return scan_ids(file_path, VERIFY_PATTERNS[os.path.splitext(file_path)[1]])
 
 
-def check_implicit_traceability(path) -> int:
+def iter_matrix(definitions, verifications):
+    """Yields the (requirement, status, detail) rows of the traceability matrix."""
+    for req_id in sorted(definitions.keys()):
+        tests = verifications.get(req_id, [])
+        if tests:
+            yield req_id, "VERIFIED", f"{len(tests)} references"
+        else:
+            yield req_id, "ORPHANED", "-"
+
+    # Tests that point to non-existent requirements
+    for req_id, test_files in verifications.items():
+        if req_id not in definitions:
+            yield req_id, "DANGLING TEST", f"Found in {test_files[0]}"
+
+
+def check_implicit_traceability(path, stderr=False) -> int:
     """
     Parses coverage.xml to find files with 0% coverage.
     If a file has 0% coverage, it means no traced test ever executes it,
     making it "Dead Code" or "Untraced Logic".
     """
+    console = get_console(stderr=stderr)
     cov_file = os.path.join(path, "coverage.xml")
     if not os.path.exists(cov_file):
         return 0
@@ -258,6 +369,17 @@ def check_implicit_traceability(path) -> int:
 
 def execute(args):
     if args.audit_command == "structure":
-        audit_structure(args.target)
+        success = audit_structure(args.target)
     elif args.audit_command == "traceability":
-        audit_traceability(args.target, args.is_global)
+        success = audit_traceability(args.target, args.is_global, args.output_format)
+    elif args.audit_command == "all":
+        # Run both so every finding is reported, then fail once at the end.
+        # The traceability scan is silent file I/O, so it runs while the schema loads and structure is checked.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            scan = pool.submit(collect_traceability, args.target, args.is_global)
+            structure_ok = audit_structure(args.target)
+            traceability_ok = audit_traceability(args.target, args.is_global, collected=scan.result())
+        success = structure_ok and traceability_ok
+
+    if not success:
+        sys.exit(1)
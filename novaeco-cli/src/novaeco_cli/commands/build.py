@@ -1,16 +1,30 @@
 import argparse
-import glob
+import functools
 import os
 import re
-import shutil
 import subprocess
 import sys
-import tarfile
 from pathlib import Path
 
-from rich.console import Console
+from novaeco_cli.utils import fs
+from novaeco_cli.utils.output import get_console
 
-console = Console()
+# PEP-621 project name line in pyproject.toml
+PROJECT_NAME_PATTERN = re.compile(r'^name\s*=\s*"([^"]+)"')
+
+# Absolute sibling imports emitted by grpc_tools in *_pb2_grpc.py. Anchored to the start of
+# a line so already-patched 'from . import x_pb2' lines are left alone on rebuilds.
+PB2_IMPORT_PATTERN = re.compile(rb"^import (\w+_pb2)\b", re.MULTILINE)
+
+# Build tools whose npm script can be run straight from node_modules/.bin, skipping the npm wrapper
+DIRECT_BUILD_TOOLS = frozenset({"vite", "react-scripts", "next", "tsc", "webpack", "rollup", "parcel"})
+
+# Characters that need a shell to interpret; scripts containing any are left to 'npm run'
+SHELL_METACHARS = frozenset("&|;<>$`'\"\\()*?~\n")
+
+# Display labels for progress messages, keyed by layer / docs perspective
+LAYER_LABELS = {"domain": "Domain", "service": "Service", "client": "Client"}
+PERSPECTIVE_LABELS = {"public": "Public", "partner": "Partner", "internal": "Internal"}
 
 
 def register_subcommand(subparsers):
@@ -57,7 +71,7 @@ def register_subcommand(subparsers):
     p_docs.add_argument(
         "perspective",
         nargs="?",
-        choices=["all", "public", "partner", "internal"],
+        choices=["all", *PERSPECTIVE_LABELS],
         default="all",
         help="Which perspective to build (default: all)",
     )
@@ -68,31 +82,54 @@ def register_subcommand(subparsers):
 
 def get_service_name():
     """Determines the current repository name dynamically without hardcoded lists."""
+    return _service_name_for(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_package_json(path, mtime_ns):
+    import json
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_package_json(path="package.json"):
+    """
+    Returns the parsed package.json at `path`, or None if it is missing or invalid.
+    Parses are keyed on the file's mtime, so repeated lookups cost a single stat().
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _parse_package_json(os.path.abspath(path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _service_name_for(cwd):
+    """Resolves the repository name for `cwd` once; builds that need it repeatedly reuse the answer."""
 
     # 1. Try Python's pyproject.toml (PEP-621 standard)
-    if os.path.exists("pyproject.toml"):
-        with open("pyproject.toml", "r", encoding="utf-8") as f:
+    pyproject = os.path.join(cwd, "pyproject.toml")
+    if os.path.isfile(pyproject):
+        with open(pyproject, "r", encoding="utf-8") as f:
             for line in f:
-                match = re.search(r'^name\s*=\s*"([^"]+)"', line.strip())
+                match = PROJECT_NAME_PATTERN.match(line.strip())
                 if match:
                     return match.group(1)
 
     # 2. Try Node's package.json (For web/frontend services)
-    if os.path.exists("package.json"):
-        import json
-
-        try:
-            with open("package.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if "name" in data:
-                    return data["name"]
-        except Exception:
-            pass
+    data = load_package_json(os.path.join(cwd, "package.json"))
+    if isinstance(data, dict) and "name" in data:
+        return data["name"]
 
     # 3. Try Git remote origin (Handles C++ only repos and /workspace mounts)
     try:
         res = subprocess.run(
-            ["git", "config", "--get", "remote.origin.url"], capture_output=True, text=True, check=True
+            ["git", "config", "--get", "remote.origin.url"], cwd=cwd, capture_output=True, text=True, check=True
         )
         url = res.stdout.strip()
         if url:
@@ -102,9 +139,9 @@ def get_service_name():
         pass
 
     # 4. Final Fallback (Local directory name)
-    name = os.path.basename(os.getcwd())
+    name = os.path.basename(cwd)
     if name == "workspace":
-        console.print(
+        get_console().print(
             "[bold red]❌ Error:[/bold red] Running in a DevContainer (/workspace) but "
             "cannot determine the project name. Missing pyproject.toml, package.json, or Git config."
         )
@@ -118,15 +155,125 @@ def run_cmd(cmd, cwd=None, env=None):
     try:
         subprocess.run(cmd, cwd=cwd, env=env, check=True)
     except subprocess.CalledProcessError:
-        console.print(f"[bold red]❌ Command Failed:[/bold red] {' '.join(cmd)}")
+        get_console().print(f"[bold red]❌ Command Failed:[/bold red] {' '.join(cmd)}")
+        sys.exit(1)
+
+
+def build_dists(src_dir, outdir="dist", config_settings=None):
+    """
+    Builds the sdist and wheel for a layer, like 'python -m build'. Runs the 'build' frontend
+    in-process when it is importable, sparing a child interpreter per layer.
+    """
+    try:
+        from build import BuildBackendException, BuildException, FailedProcessError, ProjectBuilder
+        from build.env import DefaultIsolatedEnv
+    except ImportError:
+        settings = [f"-C{key}={value}" for key, value in (config_settings or {}).items()]
+        run_cmd([sys.executable, "-m", "build", src_dir, "--outdir", outdir, *settings])
+        return
+
+    import tarfile
+    import tempfile
+
+    console = get_console()
+    try:
+        with DefaultIsolatedEnv() as env:
+            console.print("   [dim]Installing build backend requirements...[/dim]")
+            builder = ProjectBuilder.from_isolated_env(env, src_dir)
+            env.install(builder.build_system_requires)
+            console.print("   [dim]Installing sdist requirements...[/dim]")
+            env.install(builder.get_requires_for_build("sdist", config_settings))
+            sdist = builder.build("sdist", outdir, config_settings)
+
+            # Like 'python -m build', the wheel is built from the unpacked sdist, so files missing
+            # from the sdist fail here rather than at install time. The environment is reused:
+            # both builds share the same build-system requirements.
+            with tempfile.TemporaryDirectory() as tmp:
+                with tarfile.open(sdist) as tar:
+                    # Extraction filters arrived in patch releases; older interpreters extract as before
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(tmp, filter="data")
+                    else:
+                        tar.extractall(tmp)
+                sdist_root = os.path.join(tmp, os.path.basename(sdist)[: -len(".tar.gz")])
+                wheel_builder = ProjectBuilder.from_isolated_env(env, sdist_root)
+                console.print("   [dim]Installing wheel requirements...[/dim]")
+                env.install(wheel_builder.get_requires_for_build("wheel", config_settings))
+                wheel_builder.build("wheel", outdir, config_settings)
+    except (BuildBackendException, BuildException, FailedProcessError, tarfile.TarError) as e:
+        console.print(f"[bold red]❌ Build Failed:[/bold red] {src_dir}: {e}")
         sys.exit(1)
 
 
+def patch_grpc_imports(target_dir):
+    """
+    Rewrites 'import x_pb2' to 'from . import x_pb2' in the generated gRPC modules.
+    Works on raw bytes and only rewrites files whose content actually changes.
+    """
+    for entry in os.scandir(target_dir):
+        if not entry.name.endswith("_pb2_grpc.py"):
+            continue
+        with open(entry.path, "rb") as f:
+            content = f.read()
+        patched = PB2_IMPORT_PATTERN.sub(rb"from . import \1", content)
+        if patched != content:
+            with open(entry.path, "wb") as f:
+                f.write(patched)
+
+
+def write_tarball(src_dir, tar_path):
+    """Packs the contents of src_dir into a .tar.gz, compressing on all cores with pigz when installed."""
+    pigz = fs.which("pigz")
+    tar = fs.which("tar")
+    if pigz and tar:
+        run_cmd([tar, f"--use-compress-program={pigz}", "-cf", tar_path, "-C", src_dir, "."])
+        return
+
+    import tarfile
+
+    # Level 6 is gzip's (and pigz's) default: a fraction of the CPU of level 9 for nearly the same size
+    with tarfile.open(tar_path, "w:gz", compresslevel=6) as tar:
+        tar.add(src_dir, arcname=".")
+
+
+def _protoc_mtime_ns():
+    """When the installed grpc_tools was last changed, so upgrading it regenerates the API code (0 if unknown)."""
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec("grpc_tools")
+        return os.stat(spec.origin).st_mtime_ns if spec and spec.origin else 0
+    except (ImportError, OSError):
+        return 0
+
+
+def stale_protos(protos, out_dir, tool_mtime_ns=0):
+    """
+    Returns the .proto files whose generated _pb2/_pb2_grpc modules are missing, older than the
+    source, or older than the protoc installation (`tool_mtime_ns`).
+    """
+    stale = []
+    for proto in protos:
+        stem = os.path.splitext(os.path.basename(proto))[0]
+        try:
+            source_mtime = os.stat(proto).st_mtime_ns
+            generated_mtime = min(
+                os.stat(os.path.join(out_dir, f"{stem}{suffix}")).st_mtime_ns for suffix in ("_pb2.py", "_pb2_grpc.py")
+            )
+        except OSError:
+            stale.append(proto)
+            continue
+        if max(source_mtime, tool_mtime_ns) > generated_mtime:
+            stale.append(proto)
+    return stale
+
+
 # --- Layer Builders ---
 
 
 def build_api():
     """Compiles Protobufs and builds the API wheel."""
+    console = get_console()
     service_name = get_service_name()
     package_name = f"{service_name.replace('-', '_')}_api"
     api_dir = "api"
@@ -144,38 +291,38 @@ def build_api():
     Path(os.path.join(api_dir, "src", package_name, "__init__.py")).touch()
     Path(os.path.join(target_src_dir, "__init__.py")).touch()
 
-    # 2. Compile Protos
-    protos = glob.glob(os.path.join(proto_dir, "*.proto"))
-    console.print("   [dim]Compiling Protobufs...[/dim]")
-    run_cmd(
-        [
-            sys.executable,
-            "-m",
-            "grpc_tools.protoc",
-            f"-I{os.path.join(api_dir, 'proto', 'v1')}",
-            f"--python_out={target_src_dir}",
-            f"--grpc_python_out={target_src_dir}",
-        ]
-        + protos
-    )
+    # 2. Compile Protos, skipped when every generated module is newer than its source.
+    # Any change recompiles all of them: protos importing a changed one embed its descriptors.
+    protos = sorted(entry.path for entry in os.scandir(proto_dir) if entry.name.endswith(".proto"))
+    if not stale_protos(protos, target_src_dir, _protoc_mtime_ns()):
+        console.print("   [dim]Generated code is up to date. Skipping protoc.[/dim]")
+    else:
+        console.print(f"   [dim]Compiling {len(protos)} Protobufs...[/dim]")
+        run_cmd(
+            [
+                sys.executable,
+                "-m",
+                "grpc_tools.protoc",
+                f"-I{os.path.join(api_dir, 'proto', 'v1')}",
+                f"--python_out={target_src_dir}",
+                f"--grpc_python_out={target_src_dir}",
+            ]
+            + protos
+        )
 
-    # 3. Patch relative imports in generated gRPC code
-    console.print("   [dim]Patching relative imports...[/dim]")
-    for filepath in glob.glob(os.path.join(target_src_dir, "*_pb2_grpc.py")):
-        with open(filepath, "r") as f:
-            content = f.read()
-        content = re.sub(r"import (\w+_pb2)", r"from . import \1", content)
-        with open(filepath, "w") as f:
-            f.write(content)
+        # 3. Patch relative imports in generated gRPC code
+        console.print("   [dim]Patching relative imports...[/dim]")
+        patch_grpc_imports(target_src_dir)
 
     # 4. Build Wheel
     console.print("   [dim]Packaging API Wheel...[/dim]")
-    run_cmd([sys.executable, "-m", "build", api_dir, "--outdir", "dist"])
+    build_dists(api_dir)
     console.print("✅ API Layer built successfully.")
 
 
 def build_core():
     """Builds the C++ Conan library and the Python Extension Wheel."""
+    console = get_console()
     if not os.path.exists("core"):
         console.print("⚠️  No 'core' directory found. Skipping C++ build.")
         return
@@ -192,20 +339,10 @@ def build_core():
     # 2. Package Python Wheel (Scikit-Build-Core)
     console.print("   [dim]Packaging Core Python Wheel...[/dim]")
     # We pass BUILD_TESTS=OFF so the production wheel doesn't require GTest
-    env = os.environ.copy()
     toolchain = os.path.abspath("core/build/Release/generators/conan_toolchain.cmake")
-    run_cmd(
-        [
-            sys.executable,
-            "-m",
-            "build",
-            "core",
-            "--outdir",
-            "dist",
-            "-Ccmake.define.BUILD_TESTS=OFF",
-            f"-Ccmake.define.CMAKE_TOOLCHAIN_FILE={toolchain}",
-        ],
-        env=env,
+    build_dists(
+        "core",
+        config_settings={"cmake.define.BUILD_TESTS": "OFF", "cmake.define.CMAKE_TOOLCHAIN_FILE": toolchain},
     )
 
     console.print("✅ Core Layer built successfully.")
@@ -213,24 +350,70 @@ def build_core():
 
 def build_python_layer(layer_name):
     """Builds standard Python wheels for Domain, Service, or Client."""
+    console = get_console()
     if not os.path.exists(layer_name):
         console.print(f"⚠️  Directory '{layer_name}' not found. Skipping.")
         return
 
-    console.print(f"\n[bold blue]📦 Building {layer_name.capitalize()} Layer...[/bold blue]")
-    run_cmd([sys.executable, "-m", "build", layer_name, "--outdir", "dist"])
-    console.print(f"✅ {layer_name.capitalize()} Layer built successfully.")
+    label = LAYER_LABELS.get(layer_name, layer_name)
+    console.print(f"\n[bold blue]📦 Building {label} Layer...[/bold blue]")
+    build_dists(layer_name)
+    console.print(f"✅ {label} Layer built successfully.")
+
+
+def direct_script_cmd(scripts, name):
+    """
+    Returns the argv that runs npm script `name` without npm, or None when npm has to run it:
+    a malformed or blank script, shell syntax, pre/post hooks, or a tool that isn't allowlisted
+    and installed locally.
+    """
+    if not isinstance(scripts, dict):
+        return None
+    script = scripts.get(name)
+    if not isinstance(script, str) or f"pre{name}" in scripts or f"post{name}" in scripts:
+        return None
+    parts = script.split()
+    if not parts or any(c in SHELL_METACHARS for c in script):
+        return None
+    tool, *rest = parts
+    binary = os.path.join("node_modules", ".bin", tool)
+    if tool not in DIRECT_BUILD_TOOLS or not os.path.isfile(binary):
+        return None
+    return [os.path.abspath(binary), *rest]
 
 
 def build_web(args):
     """Builds Node.js / React frontends."""
-    if not shutil.which("npm"):
+    console = get_console()
+    npm = fs.which("npm")
+    if not npm:
         console.print("[bold red]❌ Error:[/bold red] 'npm' not found. Run this in a Node container.")
         sys.exit(1)
 
+    # Check for the build script up front instead of letting 'npm run' find out after 'npm ci'
+    package = load_package_json()
+    if not isinstance(package, dict):
+        console.print("[bold red]❌ Error:[/bold red] No readable package.json in the current directory.")
+        sys.exit(1)
+    scripts = package.get("scripts")
+    if not isinstance(scripts, dict):
+        scripts = {}
+    if "build" not in scripts:
+        available = ", ".join(sorted(scripts)) or "none"
+        console.print(f"[bold red]❌ Error:[/bold red] package.json has no 'build' script (available: {available}).")
+        sys.exit(1)
+
     console.print("\n[bold blue]🌍 Building Web Project...[/bold blue]")
-    run_cmd(["npm", "ci"])
-    run_cmd(["npm", "run", "build"])
+    run_cmd([npm, "ci"])
+
+    direct = direct_script_cmd(scripts, "build")
+    if direct:
+        # Same PATH 'npm run' would give the tool, so anything it spawns from .bin still resolves
+        env = os.environ.copy()
+        env["PATH"] = os.path.abspath(os.path.join("node_modules", ".bin")) + os.pathsep + env.get("PATH", "")
+        run_cmd(direct, env=env)
+    else:
+        run_cmd([npm, "run", "build"])
 
     dist_dir = args.out_dir
     os.makedirs(dist_dir, exist_ok=True)
@@ -238,22 +421,22 @@ def build_web(args):
     tar_path = os.path.join(dist_dir, tar_name)
 
     console.print(f"   [dim]Packaging {args.build_dir} to {tar_name}...[/dim]")
-    with tarfile.open(tar_path, "w:gz") as tar:
-        tar.add(args.build_dir, arcname=".")
+    write_tarball(args.build_dir, tar_path)
 
     console.print("✅ Web Layer packaged successfully.")
 
 
 def build_docs(perspective):
     """Builds Sphinx documentation for specified perspectives."""
+    console = get_console()
     if not os.path.exists("docs/source"):
         console.print("⚠️  No 'docs/source' directory found. Skipping.")
         return
 
-    perspectives = ["public", "partner", "internal"] if perspective == "all" else [perspective]
+    perspectives = list(PERSPECTIVE_LABELS) if perspective == "all" else [perspective]
 
     for p in perspectives:
-        console.print(f"\n[bold blue]📚 Building Docs ({p.capitalize()} Perspective)...[/bold blue]")
+        console.print(f"\n[bold blue]📚 Building Docs ({PERSPECTIVE_LABELS[p]} Perspective)...[/bold blue]")
 
         # Ensure target directory exists
         os.makedirs(f"docs/build/{p}", exist_ok=True)
@@ -275,6 +458,8 @@ def build_docs(perspective):
 
 
 def execute(args):
+    console = get_console()
+
     # Ensure dist folder exists and is clean-ish
     os.makedirs("dist", exist_ok=True)
 
@@ -98,6 +98,14 @@ def compute_new_version(current, increment):
         sys.exit(1)
 
 
+def group_targets(targets):
+    """Groups the (path, regex, replacement) rules by file so each file is read and written once."""
+    grouped = {}
+    for filepath, regex, repl in targets:
+        grouped.setdefault(filepath, []).append((regex, repl))
+    return grouped
+
+
 def execute(args):
     current_version = get_current_version()
     new_version = compute_new_version(current_version, args.increment)
@@ -105,19 +113,26 @@ def execute(args):
     console.print(f"\n[bold blue]🚀 Bumping Version: {current_version} -> {new_version}[/bold blue]\n")
 
     files_updated = 0
-    for filepath, regex, repl in TARGETS:
+    for filepath, rules in group_targets(TARGETS).items():
         if not os.path.exists(filepath):
             continue
 
-        with open(filepath, "r", encoding="utf-8") as f:
+        # Read and rewrite through a single handle rather than reopening the file for writing
+        with open(filepath, "r+", encoding="utf-8") as f:
             content = f.read()
 
-        # Execute the regex replacement
-        new_content, count = re.subn(regex, repl.format(new_version), content, flags=re.MULTILINE)
+            # Execute every regex replacement for this file against the one in-memory copy
+            total = 0
+            for regex, repl in rules:
+                content, count = re.subn(regex, repl.format(new_version), content, flags=re.MULTILINE)
+                total += count
+
+            if total > 0:
+                f.seek(0)
+                f.write(content)
+                f.truncate()
 
-        if count > 0:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(new_content)
+        if total > 0:
             console.print(f"   [green]✅ Updated:[/green] {filepath}")
             files_updated += 1
 
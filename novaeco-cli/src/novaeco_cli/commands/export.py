@@ -1,75 +1,91 @@
-import argparse
 import fnmatch
 import os
 import subprocess
 import sys
 
+from novaeco_cli.utils.output import err
+
 # --- Configuration & Defaults ---
 
-DEFAULT_EXCLUDE_DIRS = {
-    ".git",
-    ".pytest_cache",
-    "node_modules",
-    "dist",
-    "build",
-    "__pycache__",
-    ".idea",
-    ".vscode",
-    ".venv",
-    "venv",
-    "bin",
-    "obj",
-    ".mypy_cache",
-    ".ruff_cache",
-    ".docusaurus",
-}
-
-DEFAULT_EXCLUDE_EXTS = {
-    # Images
-    "png",
-    "jpg",
-    "jpeg",
-    "gif",
-    "ico",
-    "svg",
-    "webp",
-    # Archives
-    "zip",
-    "tar",
-    "gz",
-    "7z",
-    "rar",
-    # Executables/Binary
-    "exe",
-    "dll",
-    "so",
-    "dylib",
-    "bin",
-    "pyc",
-    "class",
-    "jar",
-    # Lock files (often huge and noisy)
-    "lock",
-}
+DEFAULT_EXCLUDE_DIRS = frozenset(
+    {
+        ".git",
+        ".pytest_cache",
+        "node_modules",
+        "dist",
+        "build",
+        "__pycache__",
+        ".idea",
+        ".vscode",
+        ".venv",
+        "venv",
+        "bin",
+        "obj",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".docusaurus",
+    }
+)
+
+DEFAULT_EXCLUDE_EXTS = frozenset(
+    {
+        # Images
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "ico",
+        "svg",
+        "webp",
+        # Archives
+        "zip",
+        "tar",
+        "gz",
+        "7z",
+        "rar",
+        # Executables/Binary
+        "exe",
+        "dll",
+        "so",
+        "dylib",
+        "bin",
+        "pyc",
+        "class",
+        "jar",
+        # Lock files (often huge and noisy)
+        "lock",
+    }
+)
 
 # Partial paths to exclude (matches if the file path ends with these)
-DEFAULT_EXCLUDE_PATHS = {
-    # Package Managers
-    "package-lock.json",
-    "yarn.lock",
-    "pnpm-lock.yaml",
-    "poetry.lock",
-    "Cargo.lock",
-    # Generated CMake/C++ Data
-    "CMakeUserPresets.json",
-    # Test Coverage & Benchmarks
-    ".coverage",
-    "benchmark_results.txt",
-    "coverage_summary.txt",
-}
+DEFAULT_EXCLUDE_PATHS = frozenset(
+    {
+        # Package Managers
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "Cargo.lock",
+        # Generated CMake/C++ Data
+        "CMakeUserPresets.json",
+        # Test Coverage & Benchmarks
+        ".coverage",
+        "benchmark_results.txt",
+        "coverage_summary.txt",
+    }
+)
+
+
+# Leading bytes inspected for NULs before a file is read in full
+BINARY_SNIFF_BYTES = 8192
+
+# Separator line framing each file's header in the export
+_BAR = b"=" * 80 + b"\n"
 
 
 def register_subcommand(subparsers):
+    import argparse
+
     # Define the examples to show in the help output
     examples = """Examples:
   # Export everything in current directory (default)
@@ -117,23 +133,41 @@ def register_subcommand(subparsers):
     parser.add_argument("--exclude-paths", nargs="+", default=[], help="Add specific path suffixes to exclude")
 
 
-def is_excluded(file_path, exclude_paths, exclude_exts):
+def is_excluded(file_path, filename, exclude_suffixes, exclude_exts):
     """Checks if a file should be skipped based on extension or specific path."""
-    filename = os.path.basename(file_path)
-
-    # 1. Check Extension
-    if "." in filename:
-        ext = filename.split(".")[-1].lower()
-        if ext in exclude_exts:
-            return True
+    # 1. Check Extension (dotfiles such as '.env' have none)
+    ext = os.path.splitext(filename)[1][1:].lower()
+    if ext and ext in exclude_exts:
+        return True
 
     # 2. Check Specific Paths (Suffix Match)
     # Matches bash script logic: find ... -path "*config/secrets.js"
-    for p in exclude_paths:
-        if file_path.endswith(p) or file_path.endswith(os.path.sep + p):
-            return True
-
-    return False
+    # One C-level endswith() call tests every suffix in the tuple
+    return file_path.endswith(exclude_suffixes)
+
+
+def _scan(root, exclude_dirs):
+    """
+    Yields a DirEntry for every file under `root`, pruning excluded (and .egg-info) directories.
+    Like os.walk, a directory's files come before its subdirectories', but entry types come
+    from the scandir listing itself rather than an extra stat per entry.
+    """
+    # Explicit stack rather than recursion, so tree depth is not bounded by the recursion limit
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs and not entry.name.endswith(".egg-info"):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+        # Reversed so the first subdirectory is popped (and walked) next, matching os.walk's order
+        stack.extend(reversed(subdirs))
 
 
 def get_git_diff(file_path, since_date):
@@ -156,27 +190,38 @@ def get_git_diff(file_path, since_date):
 
 
 def process_file(file_path, changes_since=None):
-    """Reads a file and returns formatted string, appending git diff if requested."""
+    """
+    Reads a file and returns the byte chunks of its export section (header, content, git diff
+    if requested), ready for out.writelines(). Returns None for binary or unreadable files.
+    """
     try:
-        # Try reading as UTF-8
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        with open(file_path, "rb") as f:
+            # Binary files that slipped through extension checks almost always contain a NUL
+            # early on (git uses the same heuristic), so reject them before reading the rest
+            head = f.read(BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return None
+            content = head + f.read()
+
+        # Only export valid UTF-8; ASCII content needs no decode to prove it
+        if not content.isascii():
+            content.decode("utf-8")
+    except (UnicodeDecodeError, OSError):
+        # Skip undecodable or unreadable files
+        return None
 
-        header = "=" * 80 + "\n"
-        header += f"### FILE: {file_path}\n"
-        header += "=" * 80 + "\n\n"
+    # Same newline handling as reading in text mode
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
-        output_str = header + content + "\n\n"
+    parts = [_BAR, b"### FILE: " + os.fsencode(file_path) + b"\n", _BAR, b"\n", content, b"\n\n"]
 
-        # Append Git Diff if requested
-        if changes_since:
-            output_str += "=== NET GIT DIFF ===\n\n"
-            output_str += get_git_diff(file_path, changes_since) + "\n\n"
+    # Append Git Diff if requested
+    if changes_since:
+        parts.append(b"=== NET GIT DIFF ===\n\n")
+        parts.append(get_git_diff(file_path, changes_since).encode("utf-8") + b"\n\n")
 
-        return output_str
-    except (UnicodeDecodeError, Exception):
-        # Skip binary or unreadable files that slipped through extension checks
-        return None
+    return parts
 
 
 def execute(args):
@@ -185,13 +230,14 @@ def execute(args):
 
     # Merge Defaults with Arguments
     if args.no_defaults:
-        exclude_dirs = set(args.exclude_dirs)
-        exclude_exts = set(args.exclude_exts)
-        exclude_paths = set(args.exclude_paths)
+        exclude_dirs = frozenset(args.exclude_dirs)
+        exclude_exts = frozenset(args.exclude_exts)
+        exclude_paths = frozenset(args.exclude_paths)
     else:
         exclude_dirs = DEFAULT_EXCLUDE_DIRS.union(args.exclude_dirs)
         exclude_exts = DEFAULT_EXCLUDE_EXTS.union(args.exclude_exts)
         exclude_paths = DEFAULT_EXCLUDE_PATHS.union(args.exclude_paths)
+    exclude_suffixes = tuple(exclude_paths)
 
     print(f"📦 Exporting content from: {root_path}")
     print(f"📄 Output target: {output_file}")
@@ -201,49 +247,46 @@ def execute(args):
         print(f"⏳ Appending git diffs since: {args.changes_since}")
 
     if not os.path.exists(root_path):
-        print(f"❌ Error: Path '{root_path}' does not exist.")
+        err(f"❌ Error: Path '{root_path}' does not exist.\n")
         sys.exit(1)
 
     files_processed = 0
 
-    with open(output_file, "w", encoding="utf-8") as out:
+    # Binary output: file contents are copied through as bytes, never decoded and re-encoded
+    with open(output_file, "wb") as out:
         # CASE 1: Single File
         if os.path.isfile(root_path):
             content = process_file(root_path, args.changes_since)
             if content:
-                out.write(content)
+                out.writelines(content)
                 files_processed = 1
 
         # CASE 2: Directory
         else:
-            for root, dirs, files in os.walk(root_path):
-                # 1. Prune Excluded Directories (in-place modification of 'dirs')
-                # We iterate over a copy so we can remove items safely
-                # Includes dynamic check to aggressively prune .egg-info directories
-                dirs[:] = [d for d in dirs if d not in exclude_dirs and not d.endswith(".egg-info")]
-
-                for file in files:
-                    # 1b. Check Match Pattern (if provided)
-                    if args.match and not fnmatch.fnmatch(file, args.match):
-                        continue
-
-                    full_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(full_path, start=os.getcwd())
-
-                    if is_excluded(rel_path, exclude_paths, exclude_exts):
-                        continue
-
-                    # Skip the output file itself if it's inside the target dir
-                    if os.path.abspath(full_path) == output_file:
-                        continue
-
-                    print(f"   + {rel_path}")
-                    content = process_file(full_path, args.changes_since)
-
-                    if content:
-                        out.write(content)
-                        files_processed += 1
-                    else:
-                        print(f"     ⚠️  Skipping binary/unreadable: {rel_path}")
+            cwd = os.getcwd()
+            for entry in _scan(root_path, exclude_dirs):
+                # 1. Check Match Pattern (if provided)
+                if args.match and not fnmatch.fnmatch(entry.name, args.match):
+                    continue
+
+                # Exclusions match on the absolute path scandir already built; relative paths are for display only
+                full_path = entry.path
+                if is_excluded(full_path, entry.name, exclude_suffixes, exclude_exts):
+                    continue
+
+                # Skip the output file itself if it's inside the target dir.
+                # The scan starts at an absolute, normalised root, so entry paths compare directly.
+                if full_path == output_file:
+                    continue
+
+                rel_path = os.path.relpath(full_path, start=cwd)
+                print(f"   + {rel_path}")
+                content = process_file(full_path, args.changes_since)
+
+                if content:
+                    out.writelines(content)
+                    files_processed += 1
+                else:
+                    err(f"     ⚠️  Skipping binary/unreadable: {rel_path}\n")
 
     print(f"\n✅ Success! Exported {files_processed} files to '{args.output}'")
@@ -1,14 +1,57 @@
-import argparse
+import functools
 import os
+import stat
 import subprocess
 import sys
+from types import MappingProxyType, SimpleNamespace
 
 from rich.console import Console
 
+from novaeco_cli.utils import fs
+
 console = Console()
 
+# Layer source roots put on PYTHONPATH so tests run against the working tree
+LAYER_SOURCE_DIRS = ["domain/src", "service/src", "client/src", "api/src"]
+
+# Python test directories per scope
+UNIT_DIRS = ["domain/tests", "service/tests", "client/tests"]
+INTEGRATION_DIRS = ["tests/integration"]
+CONTRACT_DIRS = ["tests/integration/contracts"]
+E2E_DIRS = ["tests/e2e"]
+
+# Scopes whose tests are independent enough to spread over pytest-xdist workers
+PARALLEL_SCOPES = frozenset({"unit", "integration"})
+
+# Test scopes in help order
+TEST_SCOPES = {
+    "all": "Run all component tests (Unit -> Contract -> E2E)",
+    "unit": "Run L5 Unit Tests (C++ Core & Python Logic)",
+    "integration": "Run L4 Integration Tests",
+    "contract": "Run L4 API Contract Tests",
+    "e2e": "Run L3 End-to-End Tests",
+    "performance": "Run L5 Micro-Benchmarks",
+    "accessibility": "Run L3 A11y Scans",
+}
+
+# Options understood by fast_parse(): long flag -> (namespace attribute, takes a value).
+# Must mirror the 'common' parent parser in register_subcommand().
+_FAST_OPTIONS = {
+    "--filter": ("filter", True),
+    "--with-cache": ("with_cache", False),
+    "--watch": ("watch", False),
+    "--verbose": ("verbose", False),
+    "--no-fail-fast": ("no_fail_fast", False),
+    "--no-parallel": ("no_parallel", False),
+}
+
+# Short aliases, resolved with one dict lookup per argument
+_SHORT = {"-f": "--filter", "-v": "--verbose"}
+
 
 def register_subcommand(subparsers):
+    import argparse
+
     examples = """Examples:
   # Run all test layers (L5 -> L4 -> L3)
   novaeco test all
@@ -21,6 +64,9 @@ def register_subcommand(subparsers):
   
   # Run L3 End-to-End Tests
   novaeco test e2e
+
+  # Runs stop at the first failure; list each test and run the whole suite
+  novaeco test unit --verbose --no-fail-fast
 """
     parser = subparsers.add_parser(
         "test",
@@ -31,13 +77,84 @@ def register_subcommand(subparsers):
 
     subs = parser.add_subparsers(dest="test_command", required=True)
 
-    subs.add_parser("all", help="Run all component tests (Unit -> Contract -> E2E)")
-    subs.add_parser("unit", help="Run L5 Unit Tests (C++ Core & Python Logic)")
-    subs.add_parser("integration", help="Run L4 Integration Tests")
-    subs.add_parser("contract", help="Run L4 API Contract Tests")
-    subs.add_parser("e2e", help="Run L3 End-to-End Tests")
-    subs.add_parser("performance", help="Run L5 Micro-Benchmarks")
-    subs.add_parser("accessibility", help="Run L3 A11y Scans")
+    # Flags shared by every scope, defined once and inherited via parents=
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-f", "--filter", help="Only run tests matching this expression (passed to pytest -k)")
+    common.add_argument(
+        "--with-cache",
+        action="store_true",
+        help="Keep pytest's .pytest_cache (needed for --lf/--ff); disabled by default to save the writes",
+    )
+    common.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="List each test as it runs (pytest -v)",
+    )
+    common.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="Keep going after the first failure (default: stop, like pytest -x)",
+    )
+    common.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Run unit/integration tests in one process even when pytest-xdist is installed",
+    )
+    common.add_argument(
+        "--watch", action="store_true", help="Re-run the Python tests on file changes (requires pytest-watch)"
+    )
+
+    for scope, help_text in TEST_SCOPES.items():
+        subs.add_parser(scope, parents=[common], help=help_text)
+
+
+def fast_parse(argv):
+    """
+    Parses 'novaeco test <scope> [options]' in a single pass without argparse.
+    Returns the same namespace register_subcommand() would produce, or None for anything else
+    (help, unknown flags, bad input) so the caller falls back to the full parser and its messages.
+    """
+    if not argv or argv[0] not in TEST_SCOPES:
+        return None
+
+    values = {dest: None if takes_value else False for dest, takes_value in _FAST_OPTIONS.values()}
+    rest = iter(argv[1:])
+    for arg in rest:
+        name, has_inline, inline = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        option = _FAST_OPTIONS.get(_SHORT.get(name, name))
+        if option is None:
+            return None
+
+        dest, takes_value = option
+        if not takes_value:
+            if has_inline:
+                return None
+            values[dest] = True
+            continue
+
+        value = inline if has_inline else next(rest, None)
+        # argparse rejects a missing value or one that looks like a flag; let it say so
+        if value is None or (not has_inline and value.startswith("-")):
+            return None
+        values[dest] = value
+
+    return SimpleNamespace(main_command="test", test_command=argv[0], **values)
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_exists(path):
+    """Whether a repo-relative path is a directory, answered with one stat() per run (see execute())."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_source_paths():
+    """Returns the absolute paths of the layer source directories present in this repo."""
+    return tuple(os.path.abspath(p) for p in LAYER_SOURCE_DIRS if _dir_exists(p))
 
 
 def get_test_env():
@@ -47,10 +164,7 @@ def get_test_env():
     requiring the developer to run `pip install -e .` after every edit.
     """
     env = os.environ.copy()
-    paths = []
-    for p in ["domain/src", "service/src", "client/src", "api/src"]:
-        if os.path.exists(p):
-            paths.append(os.path.abspath(p))
+    paths = get_source_paths()
 
     if paths:
         existing = env.get("PYTHONPATH", "")
@@ -59,9 +173,53 @@ def get_test_env():
     return env
 
 
-def run_pytest(target_dirs, name, allow_fail=False):
-    """Helper to run pytest safely against a list of directories."""
-    valid_dirs = [d for d in target_dirs if os.path.exists(d)]
+def invoke_pytest(pytest_args, final=False, watch=False):
+    """
+    Runs pytest and returns its exit code. Runs in this interpreter via pytest.main() when
+    pytest is importable, skipping a second interpreter start-up and plugin discovery;
+    otherwise falls back to the pytest found on PATH. With final=True nothing runs after
+    pytest, so the fallback replaces this process instead of waiting on a child.
+    watch=True hands over to pytest-watch for good; execute() only asks when 'ptw' is installed.
+    """
+    env = get_test_env()
+    if watch:
+        ptw = fs.which("ptw")
+        sys.stdout.flush()
+        os.execve(ptw, [ptw, "--", *pytest_args], env)
+    try:
+        import pytest
+    except ImportError:
+        pytest_exe = fs.which("pytest")
+        if pytest_exe is None:
+            console.print("[bold red]❌ 'pytest' not found. Install the dev dependencies first.[/bold red]")
+            return 1
+        if final:
+            sys.stdout.flush()
+            os.execve(pytest_exe, [pytest_exe, *pytest_args], env)
+        return subprocess.run([pytest_exe, *pytest_args], env=env).returncode
+
+    # Mirror the subprocess environment: sources importable here, and PYTHONPATH for anything tests spawn
+    saved_path = sys.path[:]
+    saved_pythonpath = os.environ.get("PYTHONPATH")
+    sys.path[:0] = get_source_paths()
+    if "PYTHONPATH" in env:
+        os.environ["PYTHONPATH"] = env["PYTHONPATH"]
+    try:
+        return int(pytest.main(pytest_args))
+    finally:
+        sys.path[:] = saved_path
+        if saved_pythonpath is None:
+            os.environ.pop("PYTHONPATH", None)
+        else:
+            os.environ["PYTHONPATH"] = saved_pythonpath
+
+
+def run_pytest(target_dirs, name, allow_fail=False, pytest_args=(), final=False, watch=False):
+    """
+    Helper to run pytest safely against a list of directories.
+    final=True marks the last step of the command, letting pytest's exit code end the run directly.
+    """
+    valid_dirs = [d for d in target_dirs if _dir_exists(d)]
 
     if not valid_dirs:
         console.print(f"⚠️  No directories found for {name}. Skipping.")
@@ -71,11 +229,11 @@ def run_pytest(target_dirs, name, allow_fail=False):
 
     # We use --import-mode=importlib to prevent module name collisions
     # (e.g., if domain/tests/test_models.py and client/tests/test_models.py both exist)
-    cmd = [sys.executable, "-m", "pytest", "--import-mode=importlib"] + valid_dirs
-
-    result = subprocess.run(cmd, env=get_test_env())
+    returncode = invoke_pytest(
+        ["--import-mode=importlib", *pytest_args] + valid_dirs, final=final and not allow_fail, watch=watch
+    )
 
-    if result.returncode != 0:
+    if returncode != 0:
         if allow_fail:
             console.print(f"[bold yellow]⚠️ {name} Failed (Non-blocking).[/bold yellow]")
         else:
@@ -88,75 +246,142 @@ def run_pytest(target_dirs, name, allow_fail=False):
 
 def run_ctest():
     """Helper to run C++ Core unit tests via CTest."""
-    if not os.path.exists("core"):
+    if not _dir_exists("core"):
         return True  # Not a hybrid repo, skip gracefully
 
     console.print("\n[bold blue]🧪 Running L5 Unit Tests (C++ Core)...[/bold blue]")
 
+    ctest = fs.which("ctest")
+    if ctest is None:
+        console.print("[bold red]❌ 'ctest' not found. Is the C++ toolchain installed?[/bold red]")
+        return False
+
     # Try using the Conan release preset (standard in CI)
-    cmd = ["ctest", "--preset", "conan-release", "--output-on-failure"]
+    cmd = [ctest, "--preset", "conan-release", "--output-on-failure"]
 
-    try:
-        result = subprocess.run(cmd, cwd="core")
-        if result.returncode != 0:
-            console.print("[bold red]❌ C++ Core Tests Failed.[/bold red]")
-            return False
-    except FileNotFoundError:
-        console.print("[bold red]❌ 'ctest' not found. Is the C++ toolchain installed?[/bold red]")
+    result = subprocess.run(cmd, cwd="core")
+    if result.returncode != 0:
+        console.print("[bold red]❌ C++ Core Tests Failed.[/bold red]")
         return False
 
     console.print("[bold green]✅ C++ Core Tests Passed.[/bold green]")
     return True
 
 
+def collapse_nested(dirs):
+    """Drops duplicates and directories inside another entry (contracts live under integration), keeping order."""
+    normalized = list(dict.fromkeys(os.path.normpath(d) for d in dirs))
+    return [d for d in normalized if not any(d.startswith(parent + os.sep) for parent in normalized)]
+
+
 # --- Layer Runners ---
 
 
-def test_unit():
+def test_unit(pytest_args=(), final=False, watch=False):
     # Run C++ Core tests first
     c_success = run_ctest()
     if not c_success:
         return False
 
     # Then run Python Logic tests
-    return run_pytest(["domain/tests", "service/tests", "client/tests"], "L5 Unit Tests (Python)")
+    return run_pytest(UNIT_DIRS, "L5 Unit Tests (Python)", pytest_args=pytest_args, final=final, watch=watch)
 
 
-def test_integration():
-    return run_pytest(["tests/integration"], "L4 Integration Tests")
+def test_integration(pytest_args=(), final=False, watch=False):
+    return run_pytest(INTEGRATION_DIRS, "L4 Integration Tests", pytest_args=pytest_args, final=final, watch=watch)
 
 
-def test_contract():
-    return run_pytest(["tests/integration/contracts"], "L4 Contract Tests")
+def test_contract(pytest_args=(), final=False, watch=False):
+    return run_pytest(CONTRACT_DIRS, "L4 Contract Tests", pytest_args=pytest_args, final=final, watch=watch)
 
 
-def test_e2e():
-    return run_pytest(["tests/e2e"], "L3 Component E2E Tests")
+def test_e2e(pytest_args=(), final=False, watch=False):
+    return run_pytest(E2E_DIRS, "L3 Component E2E Tests", pytest_args=pytest_args, final=final, watch=watch)
 
 
-def test_performance():
-    return run_pytest(["tests/performance"], "L5 Performance Benchmarks")
+def test_performance(pytest_args=(), final=False, watch=False):
+    return run_pytest(
+        ["tests/performance"], "L5 Performance Benchmarks", pytest_args=pytest_args, final=final, watch=watch
+    )
 
 
-def test_accessibility():
+def test_accessibility(pytest_args=(), final=False, watch=False):
     # Accessibility is often allowed to fail in early dev, so we pass allow_fail=True
     # or you can enforce it strictly by removing that parameter.
-    return run_pytest(["tests/accessibility"], "L3 Accessibility Scans")
+    return run_pytest(
+        ["tests/accessibility"], "L3 Accessibility Scans", pytest_args=pytest_args, final=final, watch=watch
+    )
+
+
+# Single-scope runners, built once at import and shared read-only by every execute() call
+_SCOPE_RUNNERS = MappingProxyType(
+    {
+        "unit": test_unit,
+        "integration": test_integration,
+        "contract": test_contract,
+        "e2e": test_e2e,
+        "performance": test_performance,
+        "accessibility": test_accessibility,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _has_xdist():
+    """Whether pytest-xdist is installed; looked up once, without importing it."""
+    import importlib.util
+
+    return importlib.util.find_spec("xdist") is not None
+
+
+def build_pytest_args(args):
+    """Translates the shared test flags into pytest arguments."""
+    pytest_args = []
+    if not getattr(args, "with_cache", False):
+        # Skip the .pytest_cache/v/cache writes pytest does at the end of every session
+        pytest_args += ["-p", "no:cacheprovider"]
+    if not getattr(args, "no_fail_fast", False):
+        pytest_args.append("-x")
+    # The session header (platform, plugins, rootdir) is noise on every run
+    pytest_args.append("--no-header")
+    if getattr(args, "verbose", False):
+        pytest_args.append("-v")
+    if getattr(args, "filter", None):
+        pytest_args += ["-k", args.filter]
+    if getattr(args, "test_command", None) in PARALLEL_SCOPES and not getattr(args, "no_parallel", False):
+        if _has_xdist():
+            # One worker per core; loadfile keeps each file on one worker so module fixtures are set up once
+            pytest_args += ["-n", "auto", "--dist", "loadfile"]
+    return pytest_args
 
 
 def execute(args):
+    # Path checks are cached for the duration of one run; start from a clean slate
+    _dir_exists.cache_clear()
+    get_source_paths.cache_clear()
+
     cmd = args.test_command
     success = True
+    pytest_args = build_pytest_args(args)
+
+    watch = getattr(args, "watch", False)
+    if watch and fs.which("ptw") is None:
+        console.print(
+            "[bold yellow]⚠️  --watch needs pytest-watch ('pip install pytest-watch'); running once.[/bold yellow]"
+        )
+        watch = False
 
     if cmd == "all":
-        # Run the full V-Model stack in order
-        success = test_unit()
-        if success:
-            success = test_contract()
-        if success:
-            success = test_integration()
+        # C++ Core first, then every Python layer (L5 -> L3) in one pytest session so
+        # interpreter start-up, plugin loading and conftest evaluation are paid once
+        success = run_ctest()
         if success:
-            success = test_e2e()
+            success = run_pytest(
+                collapse_nested(UNIT_DIRS + CONTRACT_DIRS + INTEGRATION_DIRS + E2E_DIRS),
+                "Component Tests (Python, L5 -> L3)",
+                pytest_args=pytest_args,
+                watch=watch,
+            )
 
         if success:
             console.print("\n[bold green]🎉 All Component Test Layers Passed![/bold green]")
@@ -164,18 +389,8 @@ def execute(args):
             console.print("\n[bold red]🛑 Test Suite Failed. Fix errors before proceeding.[/bold red]")
             sys.exit(1)
 
-    elif cmd == "unit":
-        success = test_unit()
-    elif cmd == "integration":
-        success = test_integration()
-    elif cmd == "contract":
-        success = test_contract()
-    elif cmd == "e2e":
-        success = test_e2e()
-    elif cmd == "performance":
-        success = test_performance()
-    elif cmd == "accessibility":
-        success = test_accessibility()
+    elif cmd in _SCOPE_RUNNERS:
+        success = _SCOPE_RUNNERS[cmd](pytest_args, final=True, watch=watch)
 
     if not success:
         sys.exit(1)
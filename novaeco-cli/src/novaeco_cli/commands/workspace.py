@@ -3,11 +3,37 @@ import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+
+from novaeco_cli.utils import cache, fs, github
+from novaeco_cli.utils.output import err
+
+# orjson is an optional speedup; the stdlib encoder produces identical output
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # --- Configuration ---
 ORG_NAME = "novaeco-tech"
 TARGET_DIR = "repos"
 WORKSPACE_FILENAME = "novaeco.code-workspace"
+GITHUB_API = "https://api.github.com"
+REPO_LIMIT = 1000
+
+# Org listing pages and their ETags, kept under ~/.cache/novaeco between runs
+REPO_CACHE_FILE = f"repos-{ORG_NAME}.json"
+
+# Default clones fetch only the current tip; '--full' restores complete history
+PARTIAL_CLONE_ARGS = ["--filter=blob:none", "--depth=1", "--single-branch"]
+
+# Cloning is network-bound, so we run more workers than there are cores.
+CLONE_WORKERS = min(16, (os.cpu_count() or 4) * 2)
 
 # Priority defines the order in the VS Code workspace file
 # Repositories are grouped by the first matching topic found in this list.
@@ -16,33 +42,110 @@ TOPIC_PRIORITY = [
     "novaeco",  # e.g., novaeco repositories
 ]
 
+# Topic -> position in TOPIC_PRIORITY (lower wins)
+TOPIC_RANK = {topic: rank for rank, topic in enumerate(TOPIC_PRIORITY)}
+
 
 def register_subcommand(subparsers):
     """Registers the 'init' command with the main argument parser."""
     parser = subparsers.add_parser("init", help="Clone repos and build workspace based on GitHub topics")
     parser.add_argument("--force", action="store_true", help="Re-clone existing repositories")
+    parser.add_argument(
+        "--full", action="store_true", help="Clone full history instead of a shallow, partial clone of the tip"
+    )
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached repository list and refetch it")
 
 
 def check_gh_cli():
     """Ensures GitHub CLI is installed and authenticated."""
     if shutil.which("gh") is None:
-        print("❌ Error: GitHub CLI ('gh') is not installed.")
-        print("   Please install it: https://cli.github.com/")
+        err("❌ Error: GitHub CLI ('gh') is not installed.\n   Please install it: https://cli.github.com/\n")
         sys.exit(1)
 
 
-def fetch_repos():
+def fetch_repos_api(token, refresh=False):
+    """
+    Fetches repository list and topics from the GitHub REST API over a single keep-alive session.
+    Each page is revalidated against the on-disk cache with If-None-Match, so an unchanged
+    org listing costs one 304 per page (which does not count against the rate limit).
+    """
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
+    url = f"{GITHUB_API}/orgs/{ORG_NAME}/repos?per_page=100"
+    cached_pages = {} if refresh else (cache.load_json(REPO_CACHE_FILE) or {}).get("pages", {})
+    pages = {}
+    repos = []
+
+    with requests.Session() as session:
+        session.headers.update(headers)
+        while url and len(repos) < REPO_LIMIT:
+            cached = cached_pages.get(url)
+            conditional = {"If-None-Match": cached["etag"]} if cached else {}
+            try:
+                resp = session.get(url, headers=conditional, timeout=30)
+                if resp.status_code != 304:
+                    resp.raise_for_status()
+            except requests.RequestException as e:
+                err(f"❌ Error fetching repos: {e}\n")
+                sys.exit(1)
+
+            if resp.status_code == 304:
+                page = cached
+            else:
+                # Project onto the same shape 'gh repo list --json' returns
+                page = {
+                    "etag": resp.headers.get("ETag"),
+                    "next": resp.links.get("next", {}).get("url"),
+                    "repos": [
+                        {
+                            "name": repo["name"],
+                            "sshUrl": repo["ssh_url"],
+                            "repositoryTopics": [{"name": t} for t in repo.get("topics") or []],
+                        }
+                        for repo in resp.json()
+                        if not repo.get("archived")
+                    ],
+                }
+
+            if page["etag"]:
+                pages[url] = page
+            repos.extend(page["repos"])
+            url = page["next"]
+
+    cache.save_json(REPO_CACHE_FILE, {"pages": pages})
+    return repos[:REPO_LIMIT]
+
+
+def fetch_repos_gh():
     """Fetches repository list and topics using 'gh' CLI."""
-    print(f"🔍 Fetching repository list from {ORG_NAME}...")
-    cmd = ["gh", "repo", "list", ORG_NAME, "--limit", "1000", "--json", "name,sshUrl,repositoryTopics", "--no-archived"]
+    check_gh_cli()
+    cmd = [
+        "gh",
+        "repo",
+        "list",
+        ORG_NAME,
+        "--limit",
+        str(REPO_LIMIT),
+        "--json",
+        "name,sshUrl,repositoryTopics",
+        "--no-archived",
+    ]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         return json.loads(result.stdout)
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error fetching repos: {e.stderr}")
+        err(f"❌ Error fetching repos: {e.stderr}\n")
         sys.exit(1)
 
 
+def fetch_repos(refresh=False):
+    """Fetches repository list and topics, preferring the REST API and falling back to 'gh'."""
+    print(f"🔍 Fetching repository list from {ORG_NAME}...")
+    token = github.get_token()
+    if token:
+        return fetch_repos_api(token, refresh)
+    return fetch_repos_gh()
+
+
 def categorize_repos(repo_list):
     """Sorts repositories into buckets based on TOPIC_PRIORITY.
     Unmatched repos are placed in an 'other' bucket."""
@@ -54,29 +157,28 @@ def categorize_repos(repo_list):
     for repo in repo_list:
         # Handle case where GitHub returns explicit null for empty topics
         raw_topics = repo.get("repositoryTopics") or []
-        repo_topics = [t["name"] for t in raw_topics]
 
-        matched = False
-
-        # Check topics in priority order
-        for topic in TOPIC_PRIORITY:
-            if topic in repo_topics:
-                categorized[topic].append(repo)
-                matched = True
-                break
+        # The highest-priority topic wins; one pass over the repo's own topics
+        best = min((TOPIC_RANK[t["name"]] for t in raw_topics if t["name"] in TOPIC_RANK), default=None)
 
         # If no priority topic matched, add to 'other' for tracking/warning
-        if not matched:
-            categorized["other"].append(repo)
+        categorized[TOPIC_PRIORITY[best] if best is not None else "other"].append(repo)
 
     return categorized
 
 
-def clone_repositories(categorized_repos, force_reclone):
+def clone_repo(repo_url, local_path, full_history=False):
+    """Clones a single repository, capturing output so parallel clones don't interleave."""
+    cmd = ["git", "clone"] + ([] if full_history else PARTIAL_CLONE_ARGS) + [repo_url, local_path]
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
+def clone_repositories(categorized_repos, force_reclone, full_history=False):
     """Clones the repositories into the target directory."""
-    if not os.path.exists(TARGET_DIR):
-        os.makedirs(TARGET_DIR)
+    os.makedirs(TARGET_DIR, exist_ok=True)
 
+    # 1. Resolve what needs cloning (serially, so removals never race a clone)
+    pending = []
     for category, repos in categorized_repos.items():
         # SKIP cloning for the 'other' category
         if category == "other":
@@ -99,8 +201,28 @@ def clone_repositories(categorized_repos, force_reclone):
                     print(f"   ✅ {repo_name} already exists (skipping)")
                     continue
 
-            print(f"   ⬇️  Cloning {repo_name}...")
-            subprocess.run(["git", "clone", repo_url, local_path], check=True)
+            pending.append((repo_name, repo_url, local_path))
+
+    if not pending:
+        return
+
+    # 2. Clone in parallel and report as each one finishes
+    print(f"\n⬇️  Cloning {len(pending)} repositories ({CLONE_WORKERS} parallel)...")
+    failed = []
+    with ThreadPoolExecutor(max_workers=CLONE_WORKERS) as pool:
+        futures = {pool.submit(clone_repo, url, local_path, full_history): name for name, url, local_path in pending}
+        for future in as_completed(futures):
+            repo_name = futures[future]
+            result = future.result()
+            if result.returncode == 0:
+                print(f"   ✅ Cloned {repo_name}")
+            else:
+                err(f"   ❌ Failed to clone {repo_name}: {result.stderr.strip()}\n")
+                failed.append(repo_name)
+
+    if failed:
+        err(f"\n❌ Error: {len(failed)} repositories failed to clone: {', '.join(sorted(failed))}\n")
+        sys.exit(1)
 
 
 def generate_workspace_json(categorized_repos):
@@ -127,36 +249,39 @@ def generate_workspace_json(categorized_repos):
     workspace_data = {
         "folders": folders,
         "settings": {
-            "files.exclude": {
-                "**/.git": True,
-                "**/.DS_Store": True,
-                "**/node_modules": True,
-                "**/__pycache__": True,
-                "**/.venv": True,
-            },
+            "files.exclude": {"**/.DS_Store": True, **{f"**/{d}": True for d in fs.NOISE_DIRS}},
             "explorer.compactFolders": False,
         },
     }
 
-    with open(WORKSPACE_FILENAME, "w") as f:
-        json.dump(workspace_data, f, indent=2)
+    if HAS_ORJSON:
+        payload = orjson.dumps(workspace_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(workspace_data, indent=2).encode("utf-8")
+
+    # Leave an unchanged file alone so editors watching it don't reload
+    target = Path(WORKSPACE_FILENAME)
+    if target.is_file() and target.read_bytes() == payload:
+        print(f"\n📝 Workspace file is up to date: {os.path.abspath(WORKSPACE_FILENAME)}")
+        return
+    target.write_bytes(payload)
 
     print(f"\n📝 Generated workspace file: {os.path.abspath(WORKSPACE_FILENAME)}")
 
 
 def execute(args):
-    check_gh_cli()
-    all_repos = fetch_repos()
+    # A forced re-clone should also start from a fresh repository list
+    all_repos = fetch_repos(refresh=args.force or args.refresh)
     categorized = categorize_repos(all_repos)
 
     # Print warning for skipped repositories
     skipped = categorized.get("other", [])
     if skipped:
-        print(f"\n⚠️  Skipped {len(skipped)} repositories (topics did not match target product):")
-        for r in skipped:
-            print(f"   - {r['name']}")
+        lines = [f"\n⚠️  Skipped {len(skipped)} repositories (topics did not match target product):"]
+        lines += [f"   - {r['name']}" for r in skipped]
+        err("\n".join(lines) + "\n")
 
-    clone_repositories(categorized, args.force)
+    clone_repositories(categorized, args.force, args.full)
     generate_workspace_json(categorized)
 
     print("\n✨ Development environment setup complete!")
@@ -1,53 +1,75 @@
-import argparse
+import importlib
 import sys
 
-from novaeco_cli.commands import audit, build, bump, check, clean, deps, docs, export, test, workspace
+# Maps each top-level command to the module implementing it (in help order).
+# Modules are imported on demand so an invocation only pays for the command it runs.
+COMMANDS = {
+    "bump": "novaeco_cli.commands.bump",
+    "init": "novaeco_cli.commands.workspace",
+    "audit": "novaeco_cli.commands.audit",
+    "export": "novaeco_cli.commands.export",
+    "build": "novaeco_cli.commands.build",
+    "test": "novaeco_cli.commands.test",
+    "check": "novaeco_cli.commands.check",
+    "docs": "novaeco_cli.commands.docs",
+    "deps": "novaeco_cli.commands.deps",
+    "clean": "novaeco_cli.commands.clean",
+}
+
+# One-line summaries for 'novaeco --help', kept here so listing the commands imports none of them.
+# Must match the help= each module passes to add_parser() (checked in tests/unit/test_main.py).
+COMMAND_HELP = {
+    "bump": "Bump the semantic version across all configuration files",
+    "init": "Clone repos and build workspace based on GitHub topics",
+    "audit": "Autonomous Governance tools for structure and traceability",
+    "export": "Export text content of files for AI context",
+    "build": "Build fractal component artifacts (Core, API, Domain, Service, Client, Docs)",
+    "test": "Execute V-Model Test Suites (L5 to L3)",
+    "check": "Run static analysis (Linting, Formatting, Type Checking, SAST)",
+    "docs": "Documentation management",
+    "deps": "Manage ecosystem dependencies (Wheels & Conan packages)",
+    "clean": "Remove build artifacts, test caches, and generated files",
+}
 
 
 def main():
+    argv = sys.argv[1:]
+    requested = argv[0] if argv else None
+
+    module = None
+    if requested in COMMANDS:
+        module = importlib.import_module(COMMANDS[requested])
+        # Commands with a hand-rolled parser handle their common invocations without argparse;
+        # anything it doesn't recognise (help, odd flags, mistakes) falls through to the full parser
+        fast_parse = getattr(module, "fast_parse", None)
+        args = fast_parse(argv[1:]) if fast_parse else None
+        if args is not None:
+            module.execute(args)
+            return
+
+    import argparse
+
     parser = argparse.ArgumentParser(prog="novaeco", description="NovaEco Developer Tools")
 
     subparsers = parser.add_subparsers(dest="main_command", help="Available commands")
 
-    # Register subcommands
-    bump.register_subcommand(subparsers)
-    workspace.register_subcommand(subparsers)
-    audit.register_subcommand(subparsers)
-    export.register_subcommand(subparsers)
-    build.register_subcommand(subparsers)
-    test.register_subcommand(subparsers)
-    check.register_subcommand(subparsers)
-    docs.register_subcommand(subparsers)
-    deps.register_subcommand(subparsers)
-    clean.register_subcommand(subparsers)
+    # Register just the requested command. For help, no arguments or unknown input the
+    # summary table is all argparse needs, so no command module is imported at all.
+    if module is not None:
+        module.register_subcommand(subparsers)
+    else:
+        for name, help_text in COMMAND_HELP.items():
+            subparsers.add_parser(name, help=help_text)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Dispatch Logic
-    if args.main_command == "bump":
-        bump.execute(args)
-    elif args.main_command == "init":
-        workspace.execute(args)
-    elif args.main_command == "audit":
-        audit.execute(args)
-    elif args.main_command == "export":
-        export.execute(args)
-    elif args.main_command == "build":
-        build.execute(args)
-    elif args.main_command == "test":
-        test.execute(args)
-    elif args.main_command == "check":
-        check.execute(args)
-    elif args.main_command == "docs":
-        docs.execute(args)
-    elif args.main_command == "deps":
-        deps.execute(args)
-    elif args.main_command == "clean":
-        clean.execute(args)
-    else:
+    if module is None or args.main_command != requested:
         parser.print_help()
         sys.exit(1)
 
+    module.execute(args)
+
 
 if __name__ == "__main__":
     main()
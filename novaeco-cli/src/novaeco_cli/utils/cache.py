@@ -0,0 +1,31 @@
+import json
+import os
+
+
+def cache_dir() -> str:
+    """Returns the NovaEco cache directory (~/.cache/novaeco, honouring XDG_CACHE_HOME), creating it on demand."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, "novaeco")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_json(name: str):
+    """Loads a cached JSON document, or returns None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(cache_dir(), name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(name: str, data) -> None:
+    """Atomically stores a JSON document in the cache. Failures are ignored: the cache is best-effort."""
+    try:
+        path = os.path.join(cache_dir(), name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,113 @@
+import functools
+import os
+import shutil
+import stat
+from collections import defaultdict
+
+# Directories that only hold VCS metadata, dependencies or caches. Hidden from the VS Code
+# workspace and never descended into by source scans.
+NOISE_DIRS = (".git", "node_modules", "__pycache__", ".venv")
+
+# Additionally skipped when walking for sources: build output and tool environments
+PRUNED_DIRS = frozenset(NOISE_DIRS) | {"venv", "dist", "build", ".tox"}
+
+# Generated packaging metadata (e.g. novaeco_cli.egg-info) is pruned by suffix
+PRUNED_SUFFIXES = (".egg-info",)
+
+
+@functools.lru_cache(maxsize=None)
+def which(name: str):
+    """shutil.which(), resolved once per process: later launches skip the $PATH search."""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_listdir(path: str, mtime_ns: int) -> frozenset:
+    return frozenset(os.listdir(path))
+
+
+def dir_entries(path: str) -> frozenset:
+    """
+    Returns the names of the entries inside `path` (empty if it is not a directory).
+    Listings are keyed on the directory's mtime, so creating or removing an entry
+    invalidates them and repeated probes cost a single stat().
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+        if not stat.S_ISDIR(st.st_mode):
+            return frozenset()
+        return _cached_listdir(path, st.st_mtime_ns)
+    except OSError:
+        return frozenset()
+
+
+def compile_layout(rel_paths) -> dict:
+    """
+    Groups relative paths into {parent: {basename: [original paths]}}.
+    Compile a rule set once, then resolve it against any root with find_missing().
+    """
+    layout: dict = defaultdict(lambda: defaultdict(list))
+    for rel_path in rel_paths:
+        norm = os.path.normpath(rel_path)
+        layout[os.path.dirname(norm)][os.path.basename(norm)].append(rel_path)
+    return {parent: dict(children) for parent, children in layout.items()}
+
+
+def find_missing(root: str, layout: dict) -> set:
+    """
+    Returns the original paths from a compiled layout that do not exist under `root`.
+    Each parent directory is listed once and compared with a single set difference.
+    Parents are visited shallowest first, so once a directory is known to be missing,
+    everything beneath it is reported without touching the filesystem again.
+    """
+    missing: set[str] = set()
+    absent: set[str] = set()
+    for parent in sorted(layout, key=lambda p: p.count(os.sep)):
+        children = layout[parent]
+        if _under_absent(parent, absent):
+            names = children.keys()
+        else:
+            names = children.keys() - dir_entries(os.path.join(root, parent))
+        for name in names:
+            missing.update(children[name])
+            absent.add(os.path.join(parent, name))
+    return missing
+
+
+def _under_absent(rel_path: str, absent: set[str]) -> bool:
+    """True if `rel_path` or one of its ancestors is in `absent`."""
+    while rel_path:
+        if rel_path in absent:
+            return True
+        rel_path = os.path.dirname(rel_path)
+    return False
+
+
+def walk_files(root: str, suffixes: tuple, prune: frozenset = PRUNED_DIRS):
+    """
+    Yields the paths of files under `root` whose names end with one of `suffixes`.
+    Pruned directories (by name, or by a PRUNED_SUFFIXES ending) are never opened.
+    Hidden entries are skipped and directory symlinks are followed, matching glob('**');
+    each directory is entered once by (st_dev, st_ino), so symlink cycles terminate.
+    """
+    visited: set[tuple[int, int]] = set()
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            st = os.stat(current)
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        if entry.name not in prune and not entry.name.endswith(PRUNED_SUFFIXES):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
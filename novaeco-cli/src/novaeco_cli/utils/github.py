@@ -0,0 +1,19 @@
+import os
+import subprocess
+
+from novaeco_cli.utils import fs
+
+
+def get_token():
+    """Retrieves the GH token from Env or Local CLI. Returns None if neither is available."""
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    gh = fs.which("gh")
+    if gh is None:
+        return None
+    try:
+        res = subprocess.run([gh, "auth", "token"], capture_output=True, text=True, check=True)
+        return res.stdout.strip() or None
+    except subprocess.CalledProcessError:
+        return None
@@ -0,0 +1,15 @@
+import functools
+import sys
+
+
+@functools.cache
+def get_console(stderr=False):
+    """Creates the Rich console on first use, so importing a command module doesn't pay for Rich."""
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
+
+def err(message):
+    """Writes a diagnostic to stderr in a single call, keeping stdout for progress output."""
+    sys.stderr.write(message)
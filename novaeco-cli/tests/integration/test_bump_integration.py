@@ -29,3 +29,21 @@ def test_bump_execute_modifies_files(tmp_path, monkeypatch):
     # 4. Verify the file on disk was actually changed
     updated_content = fake_toml.read_text()
     assert 'version = "1.1.0"' in updated_content
+
+
+def test_bump_execute_shrinking_version_truncates_file(tmp_path, monkeypatch):
+    """A shorter version string must not leave stale bytes at the end of the rewritten file."""
+    fake_toml = tmp_path / "pyproject.toml"
+    fake_toml.write_text('version = "10.20.30"\nname = "test"\n')
+
+    monkeypatch.setattr(
+        "novaeco_cli.commands.bump.TARGETS", [(str(fake_toml), r'^(version\s*=\s*")[^"]+(")', r"\g<1>{}\g<2>")]
+    )
+    monkeypatch.chdir(tmp_path)
+
+    args = MagicMock()
+    args.increment = "1.0.0"
+
+    execute(args)
+
+    assert fake_toml.read_text() == 'version = "1.0.0"\nname = "test"\n'
@@ -0,0 +1,162 @@
+from argparse import Namespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from novaeco_cli.commands import audit
+
+
+@pytest.fixture
+def component(tmp_path):
+    """A minimal component with one documented requirement and one test verifying it."""
+    (tmp_path / "docs" / "source").mkdir(parents=True)
+    (tmp_path / "docs" / "source" / "reqs.rst").write_text(".. req:: Example\n   :id: REQ_DEVTOOLS_FUNCTIONAL_0001\n")
+    (tmp_path / "tests" / "unit").mkdir(parents=True)
+    (tmp_path / "tests" / "unit" / "test_example.py").write_text(
+        '@pytest.mark.requirement("REQ_DEVTOOLS_FUNCTIONAL_0001")\ndef test_example():\n    pass\n'
+    )
+    return tmp_path
+
+
+def test_scan_verifications_per_file_type(tmp_path):
+    """Verify each file type is matched with its own verification pattern."""
+    py_file = tmp_path / "test_a.py"
+    py_file.write_text('@requirement("REQ_A_B_0001")\n@pytest.mark.requirement("REQ_A_B_0002")\n')
+    cpp_file = tmp_path / "engine.cpp"
+    cpp_file.write_text("// REQ_KERNEL_PERFORMANCE_0001\nint main() {}\n")
+    feature_file = tmp_path / "login.feature"
+    feature_file.write_text("@USECASE_QA_0001\nFeature: Login\n")
+
+    assert audit.scan_verifications(str(py_file)) == ["REQ_A_B_0001", "REQ_A_B_0002"]
+    assert audit.scan_verifications(str(cpp_file)) == ["REQ_KERNEL_PERFORMANCE_0001"]
+    assert audit.scan_verifications(str(feature_file)) == ["USECASE_QA_0001"]
+
+
+def test_collect_traceability_maps_definitions_and_verifications(component):
+    """Verify the silent scan returns where each requirement is defined and which files verify it."""
+    definitions, verifications = audit.collect_traceability(str(component))
+
+    assert definitions == {"REQ_DEVTOOLS_FUNCTIONAL_0001": "docs/source/reqs.rst"}
+    assert verifications == {"REQ_DEVTOOLS_FUNCTIONAL_0001": ["tests/unit/test_example.py"]}
+
+
+def test_traceability_passes_when_all_requirements_verified(component):
+    """Verify a fully traced component does not fail the audit."""
+    assert audit.audit_traceability(str(component)) is True
+
+
+def test_traceability_fails_on_orphaned_requirement(component):
+    """Verify a requirement without any test fails the audit."""
+    (component / "tests" / "unit" / "test_example.py").write_text("def test_example():\n    pass\n")
+
+    assert audit.audit_traceability(str(component)) is False
+
+
+@pytest.fixture
+def workspace_with_schema(tmp_path):
+    """A workspace whose sibling 'novaeco' repo provides the golden component schema."""
+    schema_dir = tmp_path / "novaeco" / "docs" / "source" / "architecture" / "templates"
+    schema_dir.mkdir(parents=True)
+    (schema_dir / "component-schema.yaml").write_text(
+        "directories:\n"
+        "  required: [api/proto, docs/source]\n"
+        "files:\n"
+        "  required: [README.md, .github/CODEOWNERS]\n"
+        "content_rules:\n"
+        "  - path: .github/workflows/ci.yml\n"
+        "    must_contain: novaeco-devtools/.github/workflows/shared-component-ci.yml\n"
+    )
+    repo = tmp_path / "novaeco-example"
+    for d in ["api/proto", "docs/source", ".github/workflows"]:
+        (repo / d).mkdir(parents=True)
+    (repo / "README.md").write_text("# Example")
+    (repo / ".github" / "CODEOWNERS").write_text("* @novaeco-tech/core")
+    (repo / ".github" / "workflows" / "ci.yml").write_text(
+        "uses: novaeco-tech/novaeco-devtools/.github/workflows/shared-component-ci.yml@v0.1.0\n"
+    )
+    return repo
+
+
+def test_structure_passes_for_compliant_component(workspace_with_schema):
+    """Verify a component matching the golden schema passes."""
+    assert audit.audit_structure(str(workspace_with_schema)) is True
+
+
+def test_structure_fails_on_missing_file(workspace_with_schema):
+    """Verify a missing required file fails the structural audit."""
+    (workspace_with_schema / ".github" / "CODEOWNERS").unlink()
+
+    assert audit.audit_structure(str(workspace_with_schema)) is False
+
+
+def test_structure_fails_on_content_drift(workspace_with_schema):
+    """Verify a caller workflow not using the shared DevTools workflow fails."""
+    (workspace_with_schema / ".github" / "workflows" / "ci.yml").write_text("runs-on: ubuntu-latest\n")
+
+    assert audit.audit_structure(str(workspace_with_schema)) is False
+
+
+def test_execute_all_runs_both_audits_before_failing(workspace_with_schema):
+    """Verify 'audit all' reports structure and traceability findings, then exits non-zero."""
+    (workspace_with_schema / "docs" / "source" / "reqs.rst").write_text(":id: REQ_DEVTOOLS_FUNCTIONAL_0001\n")
+
+    with pytest.raises(SystemExit) as exc:
+        audit.execute(Namespace(audit_command="all", target=str(workspace_with_schema), is_global=False))
+
+    assert exc.value.code == 1
+
+
+def test_traceability_tsv_streams_rows_to_stdout(component, capsys):
+    """Verify TSV mode writes one tab-separated row per requirement and keeps diagnostics off stdout."""
+    assert audit.audit_traceability(str(component), output_format="tsv") is True
+
+    out = capsys.readouterr().out.splitlines()
+    assert out == ["requirement\tstatus\tverified_by", "REQ_DEVTOOLS_FUNCTIONAL_0001\tVERIFIED\t1 references"]
+
+
+def make_schema_response(status_code, text="", etag=None):
+    """Builds a fake requests.Response for the raw schema download."""
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.text = text
+    resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+def test_remote_schema_is_revalidated_with_etag(tmp_path, monkeypatch, mocker):
+    """Verify the remote schema is cached and a 304 answer reuses the cached text."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    mocker.patch("novaeco_cli.utils.github.get_token", return_value="token")
+    get = mocker.patch(
+        "novaeco_cli.commands.audit.requests.get",
+        side_effect=[make_schema_response(200, "directories: {}\n", etag='"v1"'), make_schema_response(304)],
+    )
+
+    assert audit.fetch_remote_schema() == "directories: {}\n"
+    assert audit.fetch_remote_schema() == "directories: {}\n"
+    assert get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_remote_schema_falls_back_to_cache_when_offline(tmp_path, monkeypatch, mocker):
+    """Verify a network failure uses the cached schema instead of aborting the audit."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    mocker.patch("novaeco_cli.utils.github.get_token", return_value="token")
+    mocker.patch(
+        "novaeco_cli.commands.audit.requests.get",
+        side_effect=[make_schema_response(200, "files: {}\n", etag='"v1"'), requests.ConnectionError("offline")],
+    )
+
+    audit.fetch_remote_schema()
+
+    assert audit.fetch_remote_schema() == "files: {}\n"
+
+
+def test_remote_schema_survives_unwritable_cache(tmp_path, monkeypatch, mocker):
+    """Verify a fetched schema is returned even when the cache directory can't be created."""
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(not_a_dir))
+    mocker.patch("novaeco_cli.utils.github.get_token", return_value="token")
+    mocker.patch("novaeco_cli.commands.audit.requests.get", return_value=make_schema_response(200, "files: {}\n"))
+
+    assert audit.fetch_remote_schema() == "files: {}\n"
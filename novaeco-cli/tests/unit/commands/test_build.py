@@ -0,0 +1,256 @@
+import os
+import sys
+import tarfile
+
+import pytest
+from novaeco_cli.commands import build
+
+
+def test_get_service_name_reads_pyproject(tmp_path, monkeypatch):
+    """Verify the PEP-621 project name is taken from pyproject.toml."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "novaeco-gateway"\nversion = "0.1.0"\n')
+
+    assert build.get_service_name() == "novaeco-gateway"
+
+
+def test_get_service_name_is_resolved_once_per_directory(tmp_path, monkeypatch, mocker):
+    """Verify repeated lookups in the same directory don't re-run git."""
+    monkeypatch.chdir(tmp_path)
+    run = mocker.patch(
+        "novaeco_cli.commands.build.subprocess.run",
+        return_value=mocker.Mock(stdout="git@github.com:novaeco-tech/novaeco-core.git\n"),
+    )
+
+    assert build.get_service_name() == "novaeco-core"
+    assert build.get_service_name() == "novaeco-core"
+    run.assert_called_once()
+
+
+def test_patch_grpc_imports_is_idempotent(tmp_path):
+    """Verify generated imports become relative once and a second patch leaves them untouched."""
+    grpc_file = tmp_path / "gateway_pb2_grpc.py"
+    grpc_file.write_text("import grpc\nimport gateway_pb2 as gateway__pb2\n")
+
+    build.patch_grpc_imports(str(tmp_path))
+    build.patch_grpc_imports(str(tmp_path))
+
+    assert grpc_file.read_text() == "import grpc\nfrom . import gateway_pb2 as gateway__pb2\n"
+
+
+def test_patch_grpc_imports_leaves_patched_files_untouched(tmp_path):
+    """Verify already-relative modules are not rewritten, so their mtime is preserved."""
+    grpc_file = tmp_path / "gateway_pb2_grpc.py"
+    grpc_file.write_text("from . import gateway_pb2 as gateway__pb2\n")
+    os.utime(grpc_file, ns=(0, 1_000_000_000))
+
+    build.patch_grpc_imports(str(tmp_path))
+
+    assert grpc_file.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_write_tarball_uses_pigz_when_available(tmp_path, mocker):
+    """Verify packaging shells out to tar with pigz as the compressor when it is installed."""
+    mocker.patch("novaeco_cli.commands.build.fs.which", side_effect=lambda tool: f"/usr/bin/{tool}")
+    run_cmd = mocker.patch("novaeco_cli.commands.build.run_cmd")
+
+    build.write_tarball("build", str(tmp_path / "app.tar.gz"))
+
+    run_cmd.assert_called_once_with(
+        [
+            "/usr/bin/tar",
+            "--use-compress-program=/usr/bin/pigz",
+            "-cf",
+            str(tmp_path / "app.tar.gz"),
+            "-C",
+            "build",
+            ".",
+        ]
+    )
+
+
+def test_write_tarball_falls_back_to_tarfile(tmp_path, mocker):
+    """Verify the in-process gzip fallback archives the directory contents at the root."""
+    mocker.patch("novaeco_cli.commands.build.fs.which", return_value=None)
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "index.html").write_text("<html></html>")
+    tar_path = tmp_path / "app.tar.gz"
+
+    build.write_tarball(str(tmp_path / "build"), str(tar_path))
+
+    with tarfile.open(tar_path) as tar:
+        assert "./index.html" in tar.getnames()
+
+
+def test_stale_protos_only_reports_changed_or_ungenerated(tmp_path):
+    """Verify a proto is stale when either generated module is missing or older than the source."""
+    proto_dir = tmp_path / "proto"
+    out_dir = tmp_path / "out"
+    proto_dir.mkdir()
+    out_dir.mkdir()
+    for stem in ("fresh", "edited", "new"):
+        (proto_dir / f"{stem}.proto").write_text('syntax = "proto3";')
+    for stem in ("fresh", "edited"):
+        (out_dir / f"{stem}_pb2.py").write_text("")
+        (out_dir / f"{stem}_pb2_grpc.py").write_text("")
+    # Sources older than their outputs, except the one edited afterwards
+    for stem in ("fresh", "edited", "new"):
+        os.utime(proto_dir / f"{stem}.proto", ns=(0, 1_000_000_000))
+    os.utime(proto_dir / "edited.proto", ns=(0, 4_000_000_000_000_000_000))
+
+    protos = sorted(str(p) for p in proto_dir.iterdir())
+
+    assert build.stale_protos(protos, str(out_dir)) == [str(proto_dir / "edited.proto"), str(proto_dir / "new.proto")]
+
+
+def test_stale_protos_treats_a_newer_protoc_as_stale(tmp_path):
+    """Verify generated code older than the installed grpc_tools is regenerated even if the sources are unchanged."""
+    (tmp_path / "api.proto").write_text('syntax = "proto3";')
+    (tmp_path / "api_pb2.py").write_text("")
+    (tmp_path / "api_pb2_grpc.py").write_text("")
+    os.utime(tmp_path / "api.proto", ns=(0, 1_000_000_000))
+    for name in ("api_pb2.py", "api_pb2_grpc.py"):
+        os.utime(tmp_path / name, ns=(0, 2_000_000_000))
+    protos = [str(tmp_path / "api.proto")]
+
+    assert build.stale_protos(protos, str(tmp_path), tool_mtime_ns=1_500_000_000) == []
+    assert build.stale_protos(protos, str(tmp_path), tool_mtime_ns=3_000_000_000) == protos
+
+
+def test_build_api_recompiles_every_proto_when_one_is_stale(tmp_path, monkeypatch, mocker):
+    """Verify one edited proto regenerates all of them, since importers embed its descriptors."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "novaeco-gateway"\n')
+    proto_dir = tmp_path / "api" / "proto" / "v1"
+    proto_dir.mkdir(parents=True)
+    (proto_dir / "common.proto").write_text('syntax = "proto3";')
+    (proto_dir / "gateway.proto").write_text('syntax = "proto3";\nimport "common.proto";')
+    mocker.patch("novaeco_cli.commands.build.stale_protos", return_value=[str(proto_dir / "common.proto")])
+    mocker.patch("novaeco_cli.commands.build.patch_grpc_imports")
+    mocker.patch("novaeco_cli.commands.build.build_dists")
+    run_cmd = mocker.patch("novaeco_cli.commands.build.run_cmd")
+
+    build.build_api()
+
+    compiled = run_cmd.call_args.args[0]
+    assert compiled[-2:] == [
+        os.path.join("api", "proto", "v1", "common.proto"),
+        os.path.join("api", "proto", "v1", "gateway.proto"),
+    ]
+
+
+def test_build_dists_falls_back_to_subprocess_without_build_package(monkeypatch, mocker):
+    """Verify 'python -m build' is used, with config settings as -C flags, when 'build' can't be imported."""
+    monkeypatch.setitem(sys.modules, "build", None)
+    run_cmd = mocker.patch("novaeco_cli.commands.build.run_cmd")
+
+    build.build_dists("core", config_settings={"cmake.define.BUILD_TESTS": "OFF"})
+
+    run_cmd.assert_called_once_with(
+        [sys.executable, "-m", "build", "core", "--outdir", "dist", "-Ccmake.define.BUILD_TESTS=OFF"]
+    )
+
+
+def test_build_web_rejects_missing_build_script_before_npm(tmp_path, monkeypatch, mocker):
+    """Verify a package.json without a 'build' script fails without spawning npm."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "package.json").write_text('{"name": "novaeco-portal", "scripts": {"test": "jest"}}')
+    mocker.patch("novaeco_cli.commands.build.fs.which", return_value="/usr/bin/npm")
+    run_cmd = mocker.patch("novaeco_cli.commands.build.run_cmd")
+
+    with pytest.raises(SystemExit) as exc:
+        build.build_web(mocker.Mock(build_dir="build", out_dir="dist"))
+
+    assert exc.value.code == 1
+    run_cmd.assert_not_called()
+
+
+def test_load_package_json_reparses_only_after_a_change(tmp_path):
+    """Verify the parsed package.json is reused until the file's mtime changes."""
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"name": "a"}')
+    os.utime(package_json, ns=(0, 1_000_000_000))
+
+    first = build.load_package_json(str(package_json))
+    assert build.load_package_json(str(package_json)) is first
+
+    package_json.write_text('{"name": "b"}')
+    os.utime(package_json, ns=(0, 2_000_000_000))
+    assert build.load_package_json(str(package_json)) == {"name": "b"}
+
+
+def test_direct_script_cmd_runs_simple_tool_scripts_without_npm(tmp_path, monkeypatch):
+    """Verify an allowlisted, locally installed tool is run directly and anything shell-like is left to npm."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "node_modules" / ".bin").mkdir(parents=True)
+    (tmp_path / "node_modules" / ".bin" / "vite").write_text("")
+    vite = str(tmp_path / "node_modules" / ".bin" / "vite")
+
+    assert build.direct_script_cmd({"build": "vite build --mode production"}, "build") == [
+        vite,
+        "build",
+        "--mode",
+        "production",
+    ]
+    assert build.direct_script_cmd({"build": "tsc && vite build"}, "build") is None
+    assert build.direct_script_cmd({"build": "NODE_ENV=production vite build"}, "build") is None
+    assert build.direct_script_cmd({"build": "vite build", "prebuild": "rimraf dist"}, "build") is None
+    assert build.direct_script_cmd({"build": "webpack"}, "build") is None
+
+
+def test_direct_script_cmd_leaves_malformed_scripts_to_npm():
+    """Verify blank or non-string scripts and a non-object 'scripts' field fall back to 'npm run'."""
+    assert build.direct_script_cmd({"build": " "}, "build") is None
+    assert build.direct_script_cmd({"build": ""}, "build") is None
+    assert build.direct_script_cmd({"build": ["vite", "build"]}, "build") is None
+    assert build.direct_script_cmd({"build": 1}, "build") is None
+    assert build.direct_script_cmd(["build"], "build") is None
+
+
+def test_build_dists_builds_the_wheel_from_the_unpacked_sdist(tmp_path, monkeypatch, mocker):
+    """Verify the in-process frontend, like 'python -m build', builds the wheel from the extracted sdist."""
+    sources = []
+
+    class FakeBuilder:
+        build_system_requires = {"setuptools"}
+
+        def __init__(self, srcdir):
+            self.srcdir = srcdir
+
+        @classmethod
+        def from_isolated_env(cls, env, srcdir):
+            sources.append(srcdir)
+            return cls(srcdir)
+
+        def get_requires_for_build(self, distribution, config_settings=None):
+            return set()
+
+        def build(self, distribution, outdir, config_settings=None):
+            if distribution == "wheel":
+                # The sdist is unpacked, so its contents (not the checkout's) are what the wheel sees
+                assert os.path.isfile(os.path.join(self.srcdir, "pyproject.toml"))
+                return os.path.join(outdir, "pkg-1.0-py3-none-any.whl")
+            sdist = os.path.join(outdir, "pkg-1.0.tar.gz")
+            staged = tmp_path / "staged" / "pkg-1.0"
+            staged.mkdir(parents=True)
+            (staged / "pyproject.toml").write_text("")
+            with tarfile.open(sdist, "w:gz") as tar:
+                tar.add(staged, arcname="pkg-1.0")
+            return sdist
+
+    env = mocker.MagicMock()
+    env.__enter__.return_value = env
+    fake_build = mocker.Mock(
+        ProjectBuilder=FakeBuilder,
+        BuildBackendException=type("BuildBackendException", (Exception,), {}),
+        BuildException=type("BuildException", (Exception,), {}),
+        FailedProcessError=type("FailedProcessError", (Exception,), {}),
+    )
+    monkeypatch.setitem(sys.modules, "build", fake_build)
+    monkeypatch.setitem(sys.modules, "build.env", mocker.Mock(DefaultIsolatedEnv=lambda: env))
+
+    build.build_dists("domain", outdir=str(tmp_path))
+
+    assert sources[0] == "domain"
+    assert os.path.basename(sources[1]) == "pkg-1.0"
+    assert env.install.call_count == 3
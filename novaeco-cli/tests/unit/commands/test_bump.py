@@ -1,5 +1,5 @@
 import pytest
-from novaeco_cli.commands.bump import compute_new_version
+from novaeco_cli.commands.bump import compute_new_version, group_targets
 
 
 def test_compute_new_version_minor():
@@ -17,3 +17,8 @@ def test_compute_new_version_exact():
 def test_compute_new_version_invalid():
     with pytest.raises(SystemExit):
         compute_new_version("invalid", "patch")
+
+
+def test_group_targets_merges_rules_per_file():
+    targets = [("a.yml", "x", "{}"), ("b.toml", "y", "{}"), ("a.yml", "z", "{}")]
+    assert group_targets(targets) == {"a.yml": [("x", "{}"), ("z", "{}")], "b.toml": [("y", "{}")]}
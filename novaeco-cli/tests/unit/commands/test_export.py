@@ -0,0 +1,161 @@
+import argparse
+import os
+import sys
+
+import pytest
+from novaeco_cli.commands import export
+
+
+def make_args(path, output, **overrides):
+    """Builds the namespace 'novaeco export' would produce."""
+    values = {
+        "path": str(path),
+        "output": str(output),
+        "match": None,
+        "no_defaults": False,
+        "changes_since": None,
+        "exclude_dirs": [],
+        "exclude_exts": [],
+        "exclude_paths": [],
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_scan_prunes_excluded_dirs_and_lists_files_first(tmp_path):
+    """Verify excluded and .egg-info directories are skipped and each directory's files precede its subdirs'."""
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "pkg.egg-info").mkdir()
+    (tmp_path / "top.py").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "deep.py").write_text("")
+    (tmp_path / "node_modules" / "dep.js").write_text("")
+    (tmp_path / "pkg.egg-info" / "PKG-INFO").write_text("")
+
+    names = [entry.name for entry in export._scan(str(tmp_path), export.DEFAULT_EXCLUDE_DIRS)]
+
+    assert names == ["top.py", "mod.py", "deep.py"]
+
+
+@pytest.fixture
+def deep_tree(tmp_path):
+    """
+    A directory chain deeper than the recursion limit, with one file at the bottom.
+    Removed level by level at teardown: pytest's own basetemp cleanup uses the recursive
+    shutil.rmtree and would hit RecursionError on it in a later session.
+    """
+    levels = []
+    deepest = str(tmp_path)
+    for _ in range(sys.getrecursionlimit() + 100):  # os.makedirs recurses per level itself
+        deepest = os.path.join(deepest, "d")
+        os.mkdir(deepest)
+        levels.append(deepest)
+    leaf = os.path.join(deepest, "leaf.py")
+    open(leaf, "w").close()
+
+    yield leaf
+
+    os.remove(leaf)
+    for level in reversed(levels):
+        os.rmdir(level)
+
+
+def test_scan_handles_trees_deeper_than_the_recursion_limit(tmp_path, deep_tree):
+    """Verify a very deep directory chain is walked without hitting RecursionError."""
+    assert [entry.path for entry in export._scan(str(tmp_path), export.DEFAULT_EXCLUDE_DIRS)] == [deep_tree]
+
+
+def test_execute_exports_text_files_and_skips_output(tmp_path, monkeypatch):
+    """Verify a directory export includes source files but not excluded ones or the output file itself."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "src" / "logo.png").write_bytes(b"\x89PNG")
+    (tmp_path / "poetry.lock").write_text("locked")
+    output = tmp_path / "context.txt"
+
+    export.execute(make_args(tmp_path, output))
+
+    content = output.read_text()
+    assert f"### FILE: {tmp_path / 'src' / 'main.py'}" in content
+    assert "print('hi')" in content
+    assert "logo.png" not in content
+    assert "poetry.lock" not in content
+    assert "### FILE: " + str(output) not in content
+
+
+def test_process_file_frames_content_and_rejects_invalid_utf8(tmp_path):
+    """Verify the export section layout, text-mode newline handling, and that non-UTF-8 files are skipped."""
+    text_file = tmp_path / "notes.txt"
+    text_file.write_bytes("héllo\r\nworld\n".encode("utf-8"))
+    latin1_file = tmp_path / "legacy.txt"
+    latin1_file.write_bytes("héllo".encode("latin-1"))
+
+    section = b"".join(export.process_file(str(text_file)))
+
+    bar = b"=" * 80 + b"\n"
+    assert section == bar + f"### FILE: {text_file}\n".encode() + bar + "\nhéllo\nworld\n\n\n".encode("utf-8")
+    assert export.process_file(str(latin1_file)) is None
+
+
+def test_process_file_rejects_binary_from_leading_bytes(tmp_path, mocker):
+    """Verify a NUL in the first chunk skips the file without reading the remainder."""
+    blob = tmp_path / "data.txt"
+    blob.write_bytes(b"PK\x03\x04\x00" + b"x" * (export.BINARY_SNIFF_BYTES * 4))
+    read_sizes = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        real_read = handle.read
+        handle.read = lambda size=-1: read_sizes.append(size) or real_read(size)
+        return handle
+
+    mocker.patch("builtins.open", tracking_open)
+
+    assert export.process_file(str(blob)) is None
+    assert read_sizes == [export.BINARY_SNIFF_BYTES]
+
+
+def test_is_excluded_matches_extensions_and_path_suffixes():
+    """Verify excluded extensions and path suffixes are skipped, as plain suffix matches."""
+    suffixes = ("config/secrets.js", "poetry.lock", "a+b.txt")
+
+    assert export.is_excluded("src/config/secrets.js", "secrets.js", suffixes, {"png"})
+    assert export.is_excluded("poetry.lock", "poetry.lock", suffixes, set())
+    assert export.is_excluded("docs/a+b.txt", "a+b.txt", suffixes, set())
+    assert export.is_excluded("assets/Logo.PNG", "Logo.PNG", suffixes, {"png"})
+    assert not export.is_excluded("src/config/secrets.json", "secrets.json", suffixes, {"png"})
+    assert not export.is_excluded("src/main.py", "main.py", (), {"png"})
+
+
+def test_is_excluded_treats_dotfiles_as_extensionless():
+    """Verify a dotfile like '.env' is not mistaken for a file with extension 'env'."""
+    assert not export.is_excluded(".env", ".env", (), {"env"})
+    assert export.is_excluded("prod.env", "prod.env", (), {"env"})
+
+
+def test_execute_skips_output_given_as_relative_path(tmp_path, monkeypatch):
+    """Verify the output file is excluded even when the root and output are given relative to the cwd."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.py").write_text("x = 1\n")
+
+    export.execute(make_args(".", "./sub/../context.txt"))
+
+    assert "context.txt" not in (tmp_path / "context.txt").read_text()
+
+
+def test_execute_reports_diagnostics_on_stderr(tmp_path, monkeypatch, capsys):
+    """Verify skipped files and a missing root are reported on stderr, leaving stdout for progress."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.txt").write_bytes(b"\x00\x01")
+
+    export.execute(make_args(tmp_path, tmp_path / "context.txt"))
+    captured = capsys.readouterr()
+    assert "Skipping binary/unreadable: data.txt" in captured.err
+    assert "Success!" in captured.out
+
+    with pytest.raises(SystemExit):
+        export.execute(make_args(tmp_path / "missing", tmp_path / "context.txt"))
+    assert "does not exist" in capsys.readouterr().err
@@ -0,0 +1,267 @@
+import argparse
+import os
+import sys
+from types import SimpleNamespace
+
+# Imported under another name so pytest doesn't collect the module's test_* layer runners
+import novaeco_cli.commands.test as runner
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_path_cache():
+    """Each test works in its own directory, so drop path checks memoized by an earlier one."""
+    runner._dir_exists.cache_clear()
+    runner.get_source_paths.cache_clear()
+
+
+def test_get_test_env_prepends_present_layer_sources(tmp_path, monkeypatch):
+    """Verify only existing layer src directories are put on PYTHONPATH, ahead of the existing value."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", "/opt/existing")
+    (tmp_path / "domain" / "src").mkdir(parents=True)
+    (tmp_path / "api" / "src").mkdir(parents=True)
+    (tmp_path / "service").mkdir()
+
+    env = runner.get_test_env()
+
+    expected = [str(tmp_path / "domain" / "src"), str(tmp_path / "api" / "src"), "/opt/existing"]
+    assert env["PYTHONPATH"] == os.pathsep.join(expected)
+
+
+def test_run_pytest_skips_when_no_target_exists(tmp_path, monkeypatch, mocker):
+    """Verify a scope without any test directory is skipped without launching pytest."""
+    monkeypatch.chdir(tmp_path)
+    run = mocker.patch("novaeco_cli.commands.test.subprocess.run")
+
+    assert runner.run_pytest(["tests/e2e"], "L3 Component E2E Tests") is True
+    run.assert_not_called()
+
+
+def test_invoke_pytest_runs_in_process_with_sources_importable(tmp_path, monkeypatch, mocker):
+    """Verify pytest.main sees the layer sources on sys.path and PYTHONPATH, and both are restored afterwards."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PYTHONPATH", raising=False)
+    (tmp_path / "domain" / "src").mkdir(parents=True)
+    source_dir = str(tmp_path / "domain" / "src")
+    seen = {}
+
+    def fake_main(args):
+        seen.update(args=args, path=sys.path[0], pythonpath=os.environ.get("PYTHONPATH"))
+        return 1
+
+    mocker.patch("pytest.main", side_effect=fake_main)
+    saved_path = sys.path[:]
+
+    assert runner.invoke_pytest(["tests/unit"]) == 1
+    assert seen == {"args": ["tests/unit"], "path": source_dir, "pythonpath": source_dir}
+    assert sys.path == saved_path
+    assert "PYTHONPATH" not in os.environ
+
+
+def test_invoke_pytest_fallback_replaces_process_on_final_step(monkeypatch, mocker):
+    """Verify the PATH pytest is exec'd when it is the command's last step and run as a child otherwise."""
+    monkeypatch.setitem(sys.modules, "pytest", None)
+    mocker.patch("novaeco_cli.commands.test.fs.which", return_value="/usr/bin/pytest")
+    # A real exec never returns; stand in for that with SystemExit
+    execve = mocker.patch("novaeco_cli.commands.test.os.execve", side_effect=SystemExit(0))
+    run = mocker.patch("novaeco_cli.commands.test.subprocess.run", return_value=mocker.Mock(returncode=0))
+
+    with pytest.raises(SystemExit):
+        runner.invoke_pytest(["tests/unit"], final=True)
+    execve.assert_called_once_with("/usr/bin/pytest", ["/usr/bin/pytest", "tests/unit"], mocker.ANY)
+    run.assert_not_called()
+
+    execve.reset_mock()
+    assert runner.invoke_pytest(["tests/unit"]) == 0
+    execve.assert_not_called()
+    run.assert_called_once()
+
+
+def test_run_ctest_reports_missing_toolchain(tmp_path, monkeypatch, mocker):
+    """Verify a hybrid repo without ctest on PATH fails with a message instead of a traceback."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "core").mkdir()
+    mocker.patch("novaeco_cli.commands.test.fs.which", return_value=None)
+    run = mocker.patch("novaeco_cli.commands.test.subprocess.run")
+
+    assert runner.run_ctest() is False
+    run.assert_not_called()
+
+
+def test_every_scope_accepts_filter_and_forwards_it_to_pytest(tmp_path, monkeypatch, mocker):
+    """Verify -f is available on each scope and reaches pytest as -k."""
+    parser = argparse.ArgumentParser()
+    runner.register_subcommand(parser.add_subparsers(dest="main_command"))
+    for scope in runner.TEST_SCOPES:
+        assert parser.parse_args(["test", scope, "-f", "login"]).filter == "login"
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tests" / "e2e").mkdir(parents=True)
+    invoke = mocker.patch("novaeco_cli.commands.test.invoke_pytest", return_value=0)
+
+    runner.execute(parser.parse_args(["test", "e2e", "--filter", "login"]))
+
+    invoke.assert_called_once_with(
+        ["--import-mode=importlib", "-p", "no:cacheprovider", "-x", "--no-header", "-k", "login", "tests/e2e"],
+        final=True,
+        watch=False,
+    )
+
+
+def test_every_scope_but_all_has_a_runner():
+    """Verify the dispatch table covers each registered single scope."""
+    assert set(runner._SCOPE_RUNNERS) == set(runner.TEST_SCOPES) - {"all"}
+
+
+def test_cache_provider_is_disabled_unless_requested():
+    """Verify pytest's cache plugin is turned off by default and left alone with --with-cache."""
+    terse = ["-x", "--no-header"]
+
+    assert runner.build_pytest_args(SimpleNamespace(with_cache=False)) == ["-p", "no:cacheprovider", *terse]
+    assert runner.build_pytest_args(SimpleNamespace(filter="db", with_cache=True)) == [*terse, "-k", "db"]
+
+
+def test_verbosity_and_fail_fast_are_independent():
+    """Verify -x is the default whatever the verbosity, and --no-fail-fast drops it with or without -v."""
+
+    def args(**flags):
+        return runner.build_pytest_args(SimpleNamespace(with_cache=True, **flags))
+
+    assert args() == ["-x", "--no-header"]
+    assert args(verbose=True) == ["-x", "--no-header", "-v"]
+    assert args(no_fail_fast=True) == ["--no-header"]
+    assert args(verbose=True, no_fail_fast=True) == ["--no-header", "-v"]
+
+
+def test_unit_and_integration_run_in_parallel_when_xdist_is_installed(mocker):
+    """Verify xdist flags are added only for parallel scopes, only when installed, and not with --no-parallel."""
+    has_xdist = mocker.patch("novaeco_cli.commands.test._has_xdist", return_value=True)
+    xdist = ["-n", "auto", "--dist", "loadfile"]
+
+    def args(scope, **flags):
+        return runner.build_pytest_args(
+            SimpleNamespace(test_command=scope, with_cache=True, no_fail_fast=True, **flags)
+        )
+
+    assert args("unit") == ["--no-header", *xdist]
+    assert args("integration") == ["--no-header", *xdist]
+    assert args("e2e") == ["--no-header"]
+    assert args("unit", no_parallel=True) == ["--no-header"]
+
+    has_xdist.return_value = False
+    assert args("unit") == ["--no-header"]
+
+
+def test_fast_parse_handles_common_invocations_and_defers_the_rest():
+    """Verify the hand-rolled parser covers scope plus filter and hands anything else back to argparse."""
+    assert runner.fast_parse(["unit"]) == SimpleNamespace(
+        main_command="test",
+        test_command="unit",
+        filter=None,
+        with_cache=False,
+        watch=False,
+        verbose=False,
+        no_fail_fast=False,
+        no_parallel=False,
+    )
+    assert runner.fast_parse(["e2e", "-f", "login"]).filter == "login"
+    assert runner.fast_parse(["e2e", "--filter=a or b"]).filter == "a or b"
+
+    for argv in (
+        [],
+        ["--help"],
+        ["unit", "-h"],
+        ["nightly"],
+        ["unit", "-f"],
+        ["unit", "--bogus"],
+        ["unit", "--with-cache=1"],
+    ):
+        assert runner.fast_parse(argv) is None
+
+
+def test_fast_parse_matches_argparse():
+    """Verify every invocation the fast path accepts parses to exactly what argparse would produce."""
+    parser = argparse.ArgumentParser()
+    runner.register_subcommand(parser.add_subparsers(dest="main_command"))
+    invocations = [
+        ["unit"],
+        ["all", "-f", "smoke"],
+        ["contract", "--filter", "payments and not slow"],
+        ["integration", "--filter=x", "-f", "y"],
+        ["e2e", "--filter="],
+        ["unit", "--with-cache", "-f", "db"],
+        ["e2e", "--watch"],
+        ["unit", "-v", "--filter", "db"],
+        ["all", "--no-fail-fast", "--verbose"],
+        ["integration", "--no-parallel"],
+    ]
+
+    for argv in invocations:
+        assert vars(runner.fast_parse(argv)) == vars(parser.parse_args(["test", *argv])), argv
+
+
+def test_path_checks_are_memoized_within_a_run(tmp_path, monkeypatch, mocker):
+    """Verify each directory is probed once per run, that a new run starts from a clean cache, and files don't count."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tests" / "e2e").mkdir(parents=True)
+    (tmp_path / "core").write_text("")
+    mocker.patch("novaeco_cli.commands.test.invoke_pytest", return_value=0)
+
+    runner.run_pytest(["tests/e2e"], "L3 Component E2E Tests")
+    runner.run_pytest(["tests/e2e"], "L3 Component E2E Tests")
+    assert runner._dir_exists.cache_info().misses == 1
+    assert runner.run_ctest() is True
+
+    (tmp_path / "tests" / "e2e").rmdir()
+    invoke = mocker.patch("novaeco_cli.commands.test.invoke_pytest")
+    runner.execute(SimpleNamespace(test_command="e2e", filter=None))
+    invoke.assert_not_called()
+
+
+def test_all_runs_python_layers_in_one_pytest_session(tmp_path, monkeypatch, mocker):
+    """Verify 'test all' runs C++ first, then a single pytest over every present layer without nested duplicates."""
+    monkeypatch.chdir(tmp_path)
+    for d in ("core", "domain/tests", "tests/integration/contracts", "tests/e2e"):
+        (tmp_path / d).mkdir(parents=True)
+    ctest = mocker.patch("novaeco_cli.commands.test.run_ctest", return_value=True)
+    invoke = mocker.patch("novaeco_cli.commands.test.invoke_pytest", return_value=0)
+
+    runner.execute(SimpleNamespace(test_command="all", filter=None))
+
+    ctest.assert_called_once_with()
+    invoke.assert_called_once_with(
+        [
+            "--import-mode=importlib",
+            "-p",
+            "no:cacheprovider",
+            "-x",
+            "--no-header",
+            "domain/tests",
+            "tests/integration",
+            "tests/e2e",
+        ],
+        final=False,
+        watch=False,
+    )
+
+
+def test_watch_hands_over_to_ptw_or_runs_once_without_it(tmp_path, monkeypatch, mocker):
+    """Verify --watch execs pytest-watch with the pytest arguments, and falls back to a single run if it's missing."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tests" / "e2e").mkdir(parents=True)
+    which = mocker.patch("novaeco_cli.commands.test.fs.which", return_value="/usr/bin/ptw")
+    execve = mocker.patch("novaeco_cli.commands.test.os.execve", side_effect=SystemExit(0))
+    main = mocker.patch("pytest.main", return_value=0)
+
+    with pytest.raises(SystemExit):
+        runner.execute(SimpleNamespace(test_command="e2e", filter=None, with_cache=True, verbose=True, watch=True))
+    execve.assert_called_once_with(
+        "/usr/bin/ptw",
+        ["/usr/bin/ptw", "--", "--import-mode=importlib", "-x", "--no-header", "-v", "tests/e2e"],
+        mocker.ANY,
+    )
+
+    which.return_value = None
+    runner.execute(SimpleNamespace(test_command="e2e", filter=None, with_cache=True, verbose=True, watch=True))
+    main.assert_called_once_with(["--import-mode=importlib", "-x", "--no-header", "-v", "tests/e2e"])
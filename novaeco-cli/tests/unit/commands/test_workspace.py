@@ -0,0 +1,149 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from novaeco_cli.commands import workspace
+
+
+def make_response(repos, next_url=None, etag=None, status_code=200):
+    """Builds a fake requests.Response for one page of the org listing."""
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = {"ETag": etag} if etag else {}
+    resp.json.return_value = repos
+    resp.links = {"next": {"url": next_url}} if next_url else {}
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Points the repository list cache at a throwaway directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def test_fetch_repos_api_follows_pagination_and_skips_archived(mocker):
+    """Verify pages are followed via the Link header and archived repos are dropped."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.get.side_effect = [
+        make_response(
+            [
+                {"name": "novaeco", "ssh_url": "git@github.com:o/novaeco.git", "topics": ["meta"], "archived": False},
+                {"name": "old", "ssh_url": "git@github.com:o/old.git", "topics": [], "archived": True},
+            ],
+            next_url="https://api.github.com/page2",
+        ),
+        make_response([{"name": "gateway", "ssh_url": "git@github.com:o/gateway.git", "topics": None}]),
+    ]
+    mocker.patch("novaeco_cli.commands.workspace.requests.Session", return_value=session)
+
+    repos = workspace.fetch_repos_api("token")
+
+    assert session.get.call_count == 2
+    assert [r["name"] for r in repos] == ["novaeco", "gateway"]
+    # Projected onto the 'gh repo list --json' shape
+    assert repos[0] == {
+        "name": "novaeco",
+        "sshUrl": "git@github.com:o/novaeco.git",
+        "repositoryTopics": [{"name": "meta"}],
+    }
+    assert repos[1]["repositoryTopics"] == []
+
+
+def test_fetch_repos_api_revalidates_cached_pages(mocker):
+    """Verify a second fetch sends the stored ETag and reuses the cached page on 304."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    page = [{"name": "novaeco", "ssh_url": "git@github.com:o/novaeco.git", "topics": ["meta"]}]
+    session.get.side_effect = [make_response(page, etag='"v1"'), make_response(None, status_code=304)]
+    mocker.patch("novaeco_cli.commands.workspace.requests.Session", return_value=session)
+
+    first = workspace.fetch_repos_api("token")
+    second = workspace.fetch_repos_api("token")
+
+    assert second == first
+    assert session.get.call_args_list[0].kwargs["headers"] == {}
+    assert session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_fetch_repos_api_refresh_skips_cache(mocker):
+    """Verify --refresh fetches unconditionally even when a cached page exists."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.get.side_effect = [make_response([], etag='"v1"'), make_response([], etag='"v2"')]
+    mocker.patch("novaeco_cli.commands.workspace.requests.Session", return_value=session)
+
+    workspace.fetch_repos_api("token")
+    workspace.fetch_repos_api("token", refresh=True)
+
+    assert session.get.call_args_list[1].kwargs["headers"] == {}
+
+
+def test_fetch_repos_falls_back_to_gh_without_token(mocker):
+    """Verify the 'gh' CLI path is used when no token can be resolved."""
+    mocker.patch("novaeco_cli.utils.github.get_token", return_value=None)
+    gh = mocker.patch("novaeco_cli.commands.workspace.fetch_repos_gh", return_value=[])
+    api = mocker.patch("novaeco_cli.commands.workspace.fetch_repos_api")
+
+    workspace.fetch_repos()
+
+    gh.assert_called_once()
+    api.assert_not_called()
+
+
+def test_categorize_repos_uses_highest_priority_topic():
+    """Verify a repo lands in the bucket of its highest-priority topic, or 'other' if none match."""
+    repos = [
+        {"name": "both", "repositoryTopics": [{"name": "novaeco"}, {"name": "meta"}]},
+        {"name": "product", "repositoryTopics": [{"name": "python"}, {"name": "novaeco"}]},
+        {"name": "untagged", "repositoryTopics": None},
+        {"name": "unrelated", "repositoryTopics": [{"name": "python"}]},
+    ]
+
+    categorized = workspace.categorize_repos(repos)
+
+    assert [r["name"] for r in categorized["meta"]] == ["both"]
+    assert [r["name"] for r in categorized["novaeco"]] == ["product"]
+    assert [r["name"] for r in categorized["other"]] == ["untagged", "unrelated"]
+
+
+CATEGORIZED = {"meta": [{"name": "novaeco"}], "novaeco": [{"name": "gateway"}], "other": [{"name": "x"}]}
+
+
+def test_generate_workspace_json_lists_priority_groups(tmp_path, monkeypatch):
+    """Verify only priority categories become workspace folders, in TOPIC_PRIORITY order."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(workspace, "HAS_ORJSON", False)
+
+    workspace.generate_workspace_json(CATEGORIZED)
+
+    data = json.loads((tmp_path / workspace.WORKSPACE_FILENAME).read_text())
+    assert [f["name"] for f in data["folders"]] == ["META: novaeco", "NOVAECO: gateway"]
+    assert data["settings"]["files.exclude"]["**/node_modules"] is True
+
+
+def test_generate_workspace_json_leaves_unchanged_file_alone(tmp_path, monkeypatch, mocker):
+    """Verify regenerating an identical workspace does not rewrite the file."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(workspace, "HAS_ORJSON", False)
+    workspace.generate_workspace_json(CATEGORIZED)
+    write_bytes = mocker.spy(workspace.Path, "write_bytes")
+
+    workspace.generate_workspace_json(CATEGORIZED)
+
+    write_bytes.assert_not_called()
+
+
+def test_generate_workspace_json_orjson_matches_stdlib(tmp_path, monkeypatch):
+    """Verify the optional orjson encoder writes byte-for-byte what the stdlib encoder would."""
+    pytest.importorskip("orjson")
+    monkeypatch.chdir(tmp_path)
+    target = tmp_path / workspace.WORKSPACE_FILENAME
+
+    monkeypatch.setattr(workspace, "HAS_ORJSON", False)
+    workspace.generate_workspace_json(CATEGORIZED)
+    stdlib_output = target.read_bytes()
+
+    monkeypatch.setattr(workspace, "HAS_ORJSON", True)
+    workspace.generate_workspace_json(CATEGORIZED)
+    assert target.read_bytes() == stdlib_output
@@ -0,0 +1,61 @@
+import argparse
+import importlib
+import subprocess
+import sys
+
+import pytest
+from novaeco_cli import main
+
+
+def test_command_help_matches_each_module():
+    """Verify the static help table lists every command with the help its module registers."""
+    assert list(main.COMMAND_HELP) == list(main.COMMANDS)
+
+    for name, module_path in main.COMMANDS.items():
+        subparsers = argparse.ArgumentParser().add_subparsers()
+        importlib.import_module(module_path).register_subcommand(subparsers)
+        [choice] = subparsers._choices_actions
+        assert (choice.dest, choice.help) == (name, main.COMMAND_HELP[name])
+
+
+def test_top_level_help_imports_no_command_modules():
+    """Verify 'novaeco --help' lists commands without importing any of them."""
+    probe = (
+        "import sys\n"
+        "from novaeco_cli import main\n"
+        "sys.argv = ['novaeco', '--help']\n"
+        "try:\n"
+        "    main.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in sys.modules if m.startswith('novaeco_cli.commands.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert "audit" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_init_and_test_commands_dispatch_to_their_modules(monkeypatch, mocker):
+    """Verify 'init' routes to the workspace module and 'test' to the test runner."""
+    workspace_execute = mocker.patch("novaeco_cli.commands.workspace.execute")
+    test_execute = mocker.patch("novaeco_cli.commands.test.execute")
+
+    monkeypatch.setattr(sys, "argv", ["novaeco", "init", "--force"])
+    main.main()
+    monkeypatch.setattr(sys, "argv", ["novaeco", "test", "unit"])
+    main.main()
+
+    assert workspace_execute.call_args.args[0].force is True
+    assert test_execute.call_args.args[0].test_command == "unit"
+
+
+def test_no_command_prints_help_and_fails(monkeypatch, capsys):
+    """Verify running without a command shows the command list and exits non-zero."""
+    monkeypatch.setattr(sys, "argv", ["novaeco"])
+
+    with pytest.raises(SystemExit) as exc:
+        main.main()
+
+    assert exc.value.code == 1
+    assert "Available commands" in capsys.readouterr().out
@@ -0,0 +1,21 @@
+from novaeco_cli.utils import cache
+
+
+def test_save_and_load_round_trip(tmp_path, monkeypatch):
+    """Verify a saved document is read back from the XDG cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    cache.save_json("repos.json", {"etag": "abc"})
+
+    assert cache.load_json("repos.json") == {"etag": "abc"}
+    assert (tmp_path / "novaeco" / "repos.json").is_file()
+
+
+def test_unusable_cache_dir_is_ignored(tmp_path, monkeypatch):
+    """Verify an XDG_CACHE_HOME that is a regular file makes saves no-ops and loads misses, without raising."""
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(not_a_dir))
+
+    assert cache.save_json("repos.json", {"etag": "abc"}) is None
+    assert cache.load_json("repos.json") is None
@@ -0,0 +1,97 @@
+import os
+
+from novaeco_cli.utils import fs
+
+
+def test_dir_entries_lists_top_level_names(tmp_path):
+    """Verify a directory listing returns the names of its direct children."""
+    (tmp_path / "api").mkdir()
+    (tmp_path / "README.md").write_text("# hi")
+
+    assert fs.dir_entries(str(tmp_path)) == {"api", "README.md"}
+
+
+def test_dir_entries_missing_or_file_is_empty(tmp_path):
+    """Verify missing paths and regular files behave like empty directories."""
+    (tmp_path / "file.txt").write_text("x")
+
+    assert fs.dir_entries(str(tmp_path / "missing")) == frozenset()
+    assert fs.dir_entries(str(tmp_path / "file.txt")) == frozenset()
+
+
+def test_dir_entries_invalidates_when_directory_changes(tmp_path):
+    """Verify the cached listing is refreshed once an entry is added."""
+    assert fs.dir_entries(str(tmp_path)) == frozenset()
+
+    (tmp_path / "new").mkdir()
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert "new" in fs.dir_entries(str(tmp_path))
+
+
+def test_walk_files_prunes_noise_and_hidden_dirs(tmp_path):
+    """Verify the walker yields matching files but never enters pruned or hidden directories."""
+    for rel in [
+        "tests/unit/test_a.py",
+        "node_modules/pkg/test_b.py",
+        ".venv/lib/test_c.py",
+        "venv/lib/test_e.py",
+        "build/test_d.py",
+        "src/pkg.egg-info/test_f.py",
+    ]:
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("")
+    (tmp_path / "tests" / "unit" / "notes.md").write_text("")
+
+    found = [os.path.relpath(p, tmp_path) for p in fs.walk_files(str(tmp_path), (".py",))]
+
+    assert found == [os.path.join("tests", "unit", "test_a.py")]
+
+
+def test_find_missing_reports_children_of_missing_parents(tmp_path):
+    """Verify grouped lookups report absent paths, including everything under an absent parent."""
+    (tmp_path / "api" / "proto").mkdir(parents=True)
+    (tmp_path / "README.md").write_text("")
+
+    layout = fs.compile_layout(["README.md", "api/proto", "api/src", "website/docs/intro.md", "LICENSE"])
+    missing = fs.find_missing(str(tmp_path), layout)
+
+    assert missing == {"api/src", "website/docs/intro.md", "LICENSE"}
+
+
+def test_compile_layout_groups_by_parent_and_keeps_original_spelling():
+    """Verify paths are grouped per parent directory while remembering how the rule spelt them."""
+    layout = fs.compile_layout(["api/proto", "api/src/", ".github/CODEOWNERS", "README.md"])
+
+    assert layout == {
+        "api": {"proto": ["api/proto"], "src": ["api/src/"]},
+        ".github": {"CODEOWNERS": [".github/CODEOWNERS"]},
+        "": {"README.md": ["README.md"]},
+    }
+
+
+def test_find_missing_skips_probes_below_missing_directories(tmp_path, mocker):
+    """Verify nothing beneath a directory already known to be missing is listed."""
+    layout = fs.compile_layout(["website", "website/docs", "website/docs/intro.md", "README.md"])
+    probe = mocker.spy(fs, "dir_entries")
+
+    missing = fs.find_missing(str(tmp_path), layout)
+
+    assert missing == {"website", "website/docs", "website/docs/intro.md", "README.md"}
+    probe.assert_called_once_with(os.path.join(str(tmp_path), ""))
+
+
+def test_walk_files_follows_directory_symlinks_without_looping(tmp_path):
+    """Verify symlinked directories are scanned like glob('**'), and a link back to an ancestor is entered once."""
+    (tmp_path / "repos" / "comp" / "tests").mkdir(parents=True)
+    (tmp_path / "repos" / "comp" / "tests" / "t.py").write_text("")
+    (tmp_path / "workspace").mkdir()
+    (tmp_path / "workspace" / "linked").symlink_to(tmp_path / "repos" / "comp", target_is_directory=True)
+    (tmp_path / "repos" / "comp" / "loop").symlink_to(tmp_path / "repos", target_is_directory=True)
+
+    found = [os.path.relpath(p, tmp_path) for p in fs.walk_files(str(tmp_path / "workspace"), (".py",))]
+
+    assert found == [os.path.join("workspace", "linked", "tests", "t.py")]
@@ -0,0 +1,23 @@
+import subprocess
+
+from novaeco_cli.utils import github
+
+
+def test_get_token_prefers_environment(monkeypatch, mocker):
+    """Verify GITHUB_TOKEN is used without consulting the gh CLI."""
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    run = mocker.patch("novaeco_cli.utils.github.subprocess.run")
+
+    assert github.get_token() == "env-token"
+    run.assert_not_called()
+
+
+def test_get_token_returns_none_without_gh_or_login(monkeypatch, mocker):
+    """Verify a missing gh CLI or a failed 'gh auth token' yields None instead of an error."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    which = mocker.patch("novaeco_cli.utils.github.fs.which", return_value=None)
+    assert github.get_token() is None
+
+    which.return_value = "/usr/bin/gh"
+    mocker.patch("novaeco_cli.utils.github.subprocess.run", side_effect=subprocess.CalledProcessError(1, "gh"))
+    assert github.get_token() is None
@@ -0,0 +1,17 @@
+from novaeco_cli.utils import output
+
+
+def test_err_writes_to_the_current_stderr(capsys):
+    """Verify diagnostics go to whatever sys.stderr is at call time, not the stream seen at import."""
+    output.err("❌ Error: broken\n")
+
+    captured = capsys.readouterr()
+    assert captured.err == "❌ Error: broken\n"
+    assert captured.out == ""
+
+
+def test_get_console_is_created_once_per_stream():
+    """Verify each stream gets a single shared console."""
+    assert output.get_console() is output.get_console()
+    assert output.get_console(stderr=True).stderr
+    assert output.get_console(stderr=True) is not output.get_console()